@@ -1,7 +1,7 @@
 import shutil
 import os
 from pathlib import Path
-from sentinel_core.safety.safety import SafetyValidator, SafetyValidationResult
+from sentinel_core.safety.safety import IssueCode, SafetyValidator, SafetyValidationResult
 from sentinel_core.models.planner import PlanSchema, PlanAction
 from sentinel_core.models.enums import ActionType
 
@@ -66,7 +66,7 @@ def test_safety():
     if res.is_safe:
         print("FAILED: System path delete was allowed!")
         exit(1)
-    if not any("protected" in i for i in res.issues):
+    if IssueCode.PROTECTED_SOURCE not in (code for code, _ in res.issues):
         print(f"FAILED: Issue message mismatch: {res.issues}")
         exit(1)
     print("OK")
@@ -93,7 +93,7 @@ def test_safety():
     if res.is_safe:
         print("FAILED: Scope escape allowed!")
         exit(1)
-    if not any("outside scope" in i for i in res.issues):
+    if IssueCode.DESTINATION_OUT_OF_SCOPE not in (code for code, _ in res.issues):
         print(f"FAILED: Issue message mismatch: {res.issues}")
         exit(1)
     print("OK")
@@ -9,6 +9,11 @@ from sentinel_core.preview import generate_terminal_preview, generate_web_previe
 from rich.console import Console
 import json
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator: pip install sentinel-core[fast]
+    orjson = None
+
 # Create a realistic sample plan
 plan = PlanSchema(
     task_id="demo_organize_downloads",
@@ -86,6 +91,13 @@ plan = PlanSchema(
 )
 
 
+def _dumps_pretty(obj) -> str:
+    """Pretty-print JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 def main():
     console = Console()
     
@@ -105,7 +117,7 @@ def main():
     console.print("[bold cyan]─────────────────────────────────────────────────────────────────────[/bold cyan]\n")
     
     web_preview = generate_web_preview(plan)
-    console.print(json.dumps(web_preview, indent=2))
+    console.print(_dumps_pretty(web_preview))
     
     console.print("\n[bold green]✓ Preview module fully functional![/bold green]")
     console.print("[dim]Both terminal and web outputs working correctly.[/dim]\n")
@@ -1,5 +1,12 @@
 """Sentinel API - FastAPI server for file organization."""
 
-from .main import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name):
+    # Import the app lazily so `sentinel_core.api.config` and friends can be
+    # used without building the FastAPI application and its routers.
+    if name == "app":
+        from .main import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,64 @@
+"""
+Concurrent Background Tasks
+
+Starlette runs a response's background tasks one after another. These helpers
+let routers run them concurrently instead.
+"""
+
+import asyncio
+import logging
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.background import BackgroundTasks
+
+logger = logging.getLogger(__name__)
+
+
+class GatherBackgroundTasks(BackgroundTasks):
+    """
+    BackgroundTasks that awaits all queued tasks together.
+
+    A failing task is logged and doesn't stop the others.
+    """
+
+    async def __call__(self) -> None:
+        results = await asyncio.gather(
+            *(task() for task in self.tasks),
+            return_exceptions=True
+        )
+        for task, result in zip(self.tasks, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Background task {getattr(task.func, '__name__', task.func)} failed: {result}",
+                    exc_info=result
+                )
+
+
+class GatherBackgroundRoute(APIRoute):
+    """
+    Route class that runs a response's background tasks concurrently.
+
+    Handlers keep declaring `background_tasks: BackgroundTasks`; the queued
+    tasks are moved into a GatherBackgroundTasks once the response is built.
+
+    Example:
+        router = APIRouter(route_class=GatherBackgroundRoute)
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            response = await original_handler(request)
+            background = response.background
+            if (
+                isinstance(background, BackgroundTasks)
+                and not isinstance(background, GatherBackgroundTasks)
+                and len(background.tasks) > 1
+            ):
+                response.background = GatherBackgroundTasks(background.tasks)
+            return response
+
+        return route_handler
@@ -4,6 +4,7 @@ API Configuration
 Settings for FastAPI server including CORS, database, and server configuration.
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -43,4 +44,19 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the shared application settings.
+    
+    Environment parsing happens once; use as a FastAPI dependency so tests can
+    swap it via app.dependency_overrides, or call get_settings.cache_clear()
+    to reload after changing the environment.
+    
+    Returns:
+        Settings: Cached settings instance
+    """
+    return Settings()
+
+
+settings = get_settings()
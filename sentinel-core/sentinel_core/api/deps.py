@@ -4,11 +4,22 @@ Dependency Injection
 Shared dependencies for FastAPI routes.
 """
 
+from functools import lru_cache
+
+from fastapi import Depends
 from sqlmodel import Session
 from sentinel_core.memory.db import get_engine
 
+from .config import Settings, get_settings
+
+
+@lru_cache(maxsize=None)
+def _get_api_engine(database_url: str):
+    """Build the API's engine once per database path and reuse it."""
+    return get_engine(database_url, shared_connection=True)
+
 
-def get_db_session() -> Session:
+def get_db_session(settings: Settings = Depends(get_settings)) -> Session:
     """
     Get database session.
     
@@ -20,6 +31,5 @@ def get_db_session() -> Session:
         def get_tasks(session: Session = Depends(get_db_session)):
             ...
     """
-    engine = get_engine()
-    with Session(engine) as session:
+    with Session(_get_api_engine(settings.database_url)) as session:
         yield session
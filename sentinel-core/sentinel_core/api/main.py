@@ -6,21 +6,38 @@ Production-grade REST API with WebSocket support for real-time task updates.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
 
-from .routers import scan, plan, preview, execute, undo, tasks, websocket
 from .websocket.manager import ws_manager
-from .config import settings
+from .config import get_settings
 from .models.responses import HealthResponse
 
 # Configure logging
+# The format below never uses thread/process fields, so skip collecting them
+# for every record (see "Optimization" in the stdlib logging HOWTO).
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# orjson renders large plan payloads several times faster than stdlib json;
+# it's an optional dependency (sentinel-core[fast]).
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponseClass
+except ImportError:
+    DefaultResponseClass = JSONResponse
+
+# App wiring (CORS, route prefixes) needs settings at import; handlers should
+# use Depends(get_settings) instead of this module-level reference.
+settings = get_settings()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -49,7 +66,8 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=DefaultResponseClass,
 )
 
 # CORS middleware - localhost only for security
@@ -57,18 +75,32 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let Starlette precompute its preflight checks instead of
+    # echoing back whatever the browser asks for.
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["content-type", "authorization", "x-request-id"],
 )
 
-# Include routers
-app.include_router(scan.router, prefix=settings.api_prefix, tags=["scan"])
-app.include_router(plan.router, prefix=settings.api_prefix, tags=["plan"])
-app.include_router(preview.router, prefix=settings.api_prefix, tags=["preview"])
-app.include_router(execute.router, prefix=settings.api_prefix, tags=["execute"])
-app.include_router(undo.router, prefix=settings.api_prefix, tags=["undo"])
-app.include_router(tasks.router, prefix=settings.api_prefix, tags=["tasks"])
-app.include_router(websocket.router, tags=["websocket"])
+
+def _wire(app: FastAPI) -> None:
+    """
+    Import and mount the API routers.
+    
+    The routers pull in the planner, executor and database layers, so they
+    are only imported once the application itself is being assembled.
+    
+    Args:
+        app: FastAPI application to attach routes to
+    """
+    from .routers import scan, plan, preview, execute, undo, tasks, websocket
+    
+    app.include_router(scan.router, prefix=settings.api_prefix, tags=["scan"])
+    app.include_router(plan.router, prefix=settings.api_prefix, tags=["plan"])
+    app.include_router(preview.router, prefix=settings.api_prefix, tags=["preview"])
+    app.include_router(execute.router, prefix=settings.api_prefix, tags=["execute"])
+    app.include_router(undo.router, prefix=settings.api_prefix, tags=["undo"])
+    app.include_router(tasks.router, prefix=settings.api_prefix, tags=["tasks"])
+    app.include_router(websocket.router, tags=["websocket"])
 
 
 @app.get("/")
@@ -103,13 +135,24 @@ async def health_check():
     )
 
 
+_wire(app)
+
+
 if __name__ == "__main__":
     import uvicorn
     
+    # libuv-based loop for the socket-heavy WebSocket fan-out; not on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
     uvicorn.run(
         "sentinel_core.api.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        loop=loop,
         log_level="info"
     )
@@ -4,19 +4,79 @@ In-Memory Task Store
 Temporary storage for tasks and plans until database integration is complete.
 """
 
-from typing import Dict, Any
+import threading
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
 
-# Global dictionary to store task data
+# Number of independently locked shards (power of two for cheap masking)
+_SHARD_COUNT = 16
+
+# Global task storage, sharded so concurrent updates to different tasks
+# (WebSocket handlers, background tasks, worker threads) don't contend on one lock.
 # Key: task_id, Value: dict containing 'plan', 'status', etc.
-task_store: Dict[str, Any] = {}
+_shards: List[Tuple[Dict[str, Dict[str, Any]], threading.Lock]] = [
+    ({}, threading.Lock()) for _ in range(_SHARD_COUNT)
+]
+
+# Task IDs in creation order (dicts keep insertion order), so listing the
+# newest tasks is a reverse walk rather than a sort over every ID
+_order: Dict[str, None] = {}
+_order_lock = threading.Lock()
+
+
+def _shard(task_id: str) -> Tuple[Dict[str, Dict[str, Any]], threading.Lock]:
+    """Get the shard (store, lock) owning a task ID."""
+    return _shards[hash(task_id) & (_SHARD_COUNT - 1)]
+
 
 def save_task(task_id: str, data: Dict[str, Any]):
-    """Save or update task data."""
-    if task_id not in task_store:
-        task_store[task_id] = {}
+    """
+    Save or update task data.
     
-    task_store[task_id].update(data)
+    Writing a 'plan' without a matching 'plan_json' drops the cached dump,
+    so get_plan_json never serves a stale plan.
+    """
+    store, lock = _shard(task_id)
+    with lock:
+        task = store.get(task_id)
+        if task is None:
+            # Stamped once, as a ready-to-serialize datetime
+            task = store[task_id] = {"created_at": datetime.now(timezone.utc)}
+            with _order_lock:
+                _order[task_id] = None
+        task.update(data)
+        if "plan" in data and "plan_json" not in data:
+            task["plan_json"] = None
 
-def get_task(task_id: str) -> Dict[str, Any]:
+def get_task(task_id: str) -> Optional[Dict[str, Any]]:
     """Get task data."""
-    return task_store.get(task_id)
+    store, _ = _shard(task_id)
+    return store.get(task_id)
+
+def get_plan_json(task_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a task's plan as a JSON-ready dict.
+    
+    The dump is cached on the task under 'plan_json'; save_task resets it
+    whenever the plan changes, so the next read re-dumps.
+    """
+    task = get_task(task_id)
+    if not task or "plan" not in task:
+        return None
+    plan_json = task.get("plan_json")
+    if plan_json is None:
+        plan = task["plan"]
+        plan_json = plan.model_dump(mode="json") if hasattr(plan, "model_dump") else plan
+        save_task(task_id, {"plan_json": plan_json})
+    return plan_json
+
+def list_recent_task_ids(offset: int = 0, limit: Optional[int] = None) -> List[str]:
+    """Get task IDs newest first, skipping `offset` and returning at most `limit`."""
+    stop = None if limit is None else offset + limit
+    with _order_lock:
+        return list(islice(reversed(_order), offset, stop))
+
+def task_count() -> int:
+    """Get the number of stored tasks."""
+    return len(_order)
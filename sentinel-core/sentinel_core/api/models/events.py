@@ -4,10 +4,16 @@ WebSocket Event Schemas
 Pydantic models for WebSocket events with comprehensive task lifecycle support.
 """
 
+import time
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class EventType(str, Enum):
@@ -39,6 +45,10 @@ class EventType(str, Enum):
     ERROR = "ERROR"
 
 
+# Wire names for every event type, computed once at import for the JSON serializer
+_EVENT_NAMES: Dict[EventType, str] = {e: e.value for e in EventType}
+
+
 class WebSocketEvent(BaseModel):
     """
     Base WebSocket event model.
@@ -48,16 +58,17 @@ class WebSocketEvent(BaseModel):
     
     event_type: EventType = Field(..., description="Type of event")
     task_id: Optional[str] = Field(None, description="Task ID this event relates to")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Event timestamp (UTC)")
+    ts_ns: int = Field(default_factory=time.time_ns, description="Event time (Unix epoch, nanoseconds)")
     message: Optional[str] = Field(None, description="Human-readable message")
     data: Dict[str, Any] = Field(default_factory=dict, description="Additional event data")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            EventType: lambda v: v.value
-        }
-        json_schema_extra = {
+    # Events are immutable once emitted; freezing also lets pydantic-core skip
+    # mutability bookkeeping on the high-rate progress events.
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "event_type": "TASK_STARTED",
                 "task_id": "task-abc-123",
@@ -69,7 +80,94 @@ class WebSocketEvent(BaseModel):
                     "path": "/Users/user/Downloads"
                 }
             }
-        }
+        },
+    )
+    
+    @computed_field(description="Event timestamp (UTC, ISO 8601)")
+    @property
+    def timestamp(self) -> str:
+        # Rendered lazily: creating an event only records the integer clock
+        return _iso_from_ns(self.ts_ns)
+    
+    @field_serializer("event_type", when_used="json")
+    def _serialize_event_type(self, value: EventType) -> str:
+        return _EVENT_NAMES[value]
+    
+    def to_json(self) -> str:
+        """
+        Serialize the event for the wire.
+        
+        With orjson installed, the fields are handed to it directly; this is
+        notably faster than pydantic's Any-typed serializer for large `data`
+        payloads such as PLAN_READY plans. Output matches model_dump_json().
+        
+        Returns:
+            str: JSON text
+        """
+        if orjson is None:
+            return self.model_dump_json()
+        return orjson.dumps(
+            {
+                "event_type": _EVENT_NAMES[self.event_type],
+                "task_id": self.task_id,
+                "ts_ns": self.ts_ns,
+                "message": self.message,
+                "data": self.data,
+                "timestamp": self.timestamp,
+            },
+            default=json_default,
+        ).decode()
+
+
+def _iso_from_ns(ts_ns: int) -> str:
+    """Renders a Unix epoch in nanoseconds as a UTC ISO 8601 string."""
+    return datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+def build_event_payload(
+    event_type: EventType,
+    task_id: Optional[str] = None,
+    message: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build the wire form of a WebSocketEvent without model validation.
+    
+    For fixed, known-good events on hot paths; the dict has the same keys
+    and order as WebSocketEvent.to_json(). Pass it to
+    ws_manager.broadcast_batched.
+    
+    Args:
+        event_type: Type of event
+        task_id: Task ID this event relates to
+        message: Human-readable message
+        data: Additional event data (not copied; don't mutate it afterwards)
+        
+    Returns:
+        Dict ready for JSON serialization
+    """
+    ts_ns = time.time_ns()
+    return {
+        "event_type": _EVENT_NAMES[event_type],
+        "task_id": task_id,
+        "ts_ns": ts_ns,
+        "message": message,
+        "data": {} if data is None else data,
+        "timestamp": _iso_from_ns(ts_ns),
+    }
+
+
+def json_default(value: Any) -> Any:
+    """
+    JSON encoder fallback for values it can't serialize natively.
+    
+    Shared by WebSocketEvent.to_json() and the WebSocket manager's encoder.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
 
 
 class ConnectionEvent(WebSocketEvent):
@@ -10,12 +10,15 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 
 from sentinel_core.cleanpc.pipeline import CleanPCPipeline
+from sentinel_core.cleanpc.hash_cache import HashCache
 from sentinel_core.planner.planner_agent import PlannerAgent
 from sentinel_core.planner.ollama_client import OllamaClient
 from sentinel_core.safety.safety import SafetyValidator
 from sentinel_core.executor.executor import Executor
 from sentinel_core.models.preferences import PreferencesSchema
-from sentinel_core.models.planner import PlanSchema
+from sentinel_core.models.planner import PlanSchema, PLAN_ACTIONS_ADAPTER
+from sentinel_core.models.enums import TaskState
+from ..memory import get_task, save_task
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +56,44 @@ ollama_client = OllamaClient()
 planner = PlannerAgent(ollama_client)
 safety = SafetyValidator()
 executor = Executor()
-pipeline = CleanPCPipeline(planner=planner, safety=safety, executor=executor)
+pipeline = CleanPCPipeline(
+    planner=planner,
+    safety=safety,
+    executor=executor,
+    hash_cache=HashCache.try_open()
+)
+
+
+def _restore_plan(task_id: str, plan_data: dict) -> PlanSchema:
+    """
+    Rebuild a submitted plan, reusing the server-issued one where possible.
+    
+    An unchanged plan is returned as-is. If only the action list was edited
+    (e.g. deselected actions), just the actions are validated. Anything else
+    goes through full PlanSchema validation.
+    
+    Args:
+        task_id: Task the plan was issued for
+        plan_data: Plan as sent back by the client
+        
+    Returns:
+        Validated PlanSchema
+    """
+    cached = get_task(task_id)
+    plan_json = cached.get("plan_json") if cached else None
+    if plan_json is None:
+        return PlanSchema(**plan_data)
+    
+    if plan_json == plan_data:
+        return cached["plan"]
+    
+    if plan_data.keys() == plan_json.keys() and "actions" in plan_data and all(
+        plan_data[key] == plan_json[key] for key in plan_json if key != "actions"
+    ):
+        actions = PLAN_ACTIONS_ADAPTER.validate_python(plan_data["actions"])
+        return cached["plan"].model_copy(update={"actions": actions})
+    
+    return PlanSchema(**plan_data)
 
 
 @router.post("/scan", response_model=CleanPCResponse)
@@ -85,9 +125,20 @@ async def scan_and_plan(request: CleanPCRequest):
             max_depth=request.max_depth
         )
         
+        plan = result["plan"]
+        plan_json = plan.model_dump(mode="json")
+        
+        # Keep the validated plan so /execute can skip re-parsing it
+        save_task(result["task_id"], {
+            "plan": plan,
+            "plan_json": plan_json,
+            "summary": result["summary"],
+            "state": TaskState.REVIEW,
+        })
+        
         return CleanPCResponse(
             task_id=result["task_id"],
-            plan=result["plan"].model_dump(),
+            plan=plan_json,
             summary=result["summary"],
             validation=result["validation"]
         )
@@ -111,8 +162,7 @@ async def execute_plan(request: ExecutePlanRequest):
     try:
         logger.info(f"Executing plan for task {request.task_id} (dry_run={request.dry_run})")
         
-        # Convert plan dict to schema
-        plan = PlanSchema(**request.plan)
+        plan = _restore_plan(request.task_id, request.plan)
         
         result = await pipeline.execute_plan(
             task_id=request.task_id,
@@ -9,13 +9,32 @@ CRITICAL: This router enforces safety validation - execution cannot proceed with
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from ..models.requests import ExecuteRequest
 from ..models.responses import ExecuteResponse
+from ..models.events import WebSocketEvent, EventType, build_event_payload
+from ..memory import get_task, save_task
 from ..websocket.manager import ws_manager
+from ..background import GatherBackgroundRoute
 from sentinel_core.models.enums import TaskState
+from sentinel_core.safety import SafetyValidator
+from sentinel_core.executor.executor import execute_plan as do_execute
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=GatherBackgroundRoute)
+
+# Plans run on dedicated threads so filesystem work never blocks the event
+# loop (and progress broadcasts); kept small since plans touch the same disks.
+EXEC_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sentinel-exec")
+
+# Stateless apart from its precomputed protected-path tables
+validator = SafetyValidator()
+
+# Fixed events sent on every execution; built as plain payloads rather than
+# validated WebSocketEvent models (the data dicts are shared, never mutated)
+_SAFETY_PASSED = (EventType.WAITING_FOR_APPROVAL, "Safety validation passed. Starting execution...", {})
+_EXECUTION_STARTED = (EventType.EXECUTION_PROGRESS, "Starting execution...", {"progress": 0})
 
 
 @router.post("/execute", response_model=ExecuteResponse)
@@ -54,7 +73,6 @@ async def execute(request: ExecuteRequest, background_tasks: BackgroundTasks):
         )
     
     # Load plan from memory store
-    from ..memory import get_task, save_task
     task_data = get_task(request.task_id)
     
     if not task_data or "plan" not in task_data:
@@ -63,38 +81,34 @@ async def execute(request: ExecuteRequest, background_tasks: BackgroundTasks):
     plan = task_data["plan"]
     
     # CRITICAL: Safety validation
-    from sentinel_core.safety import SafetyValidator
-    validator = SafetyValidator()
-    validation_result = validator.validate_plan(plan)
-    
-    import asyncio
-    from ..models.events import WebSocketEvent, EventType
+    # Runs on a worker thread: it stats every path in the plan, which would
+    # otherwise stall the event loop for large plans. It is deliberately not
+    # memoized - the filesystem can change between retries.
+    validation_result = await asyncio.to_thread(validator.validate_plan, plan)
     
     if not validation_result.is_safe:
         logger.error(f"Safety validation failed for {request.task_id}: {validation_result.errors}")
-        await ws_manager.broadcast(WebSocketEvent(
-            event_type=EventType.TASK_FAILED,
-            task_id=request.task_id,
-            message="Plan failed safety validation",
-            data={"errors": validation_result.errors}
-        ))
+        if ws_manager.has_subscribers:
+            await ws_manager.broadcast(WebSocketEvent(
+                event_type=EventType.TASK_FAILED,
+                task_id=request.task_id,
+                message="Plan failed safety validation",
+                data={"errors": validation_result.errors}
+            ))
         raise HTTPException(
             status_code=400,
             detail=f"Plan failed safety validation: {validation_result.errors}"
         )
     
     # Broadcast safety passed
-    await ws_manager.broadcast(WebSocketEvent(
-        event_type=EventType.WAITING_FOR_APPROVAL, # Or generic info
-        task_id=request.task_id,
-        message="Safety validation passed. Starting execution...",
-        data={}
-    ))
+    if ws_manager.has_subscribers:
+        event_type, message, data = _SAFETY_PASSED
+        await ws_manager.broadcast_batched(
+            build_event_payload(event_type, request.task_id, message, data)
+        )
     
     async def perform_execution(task_id: str, plan):
         try:
-            from sentinel_core.executor.executor import execute_plan as do_execute
-            
             logger.warning(f"[EXEC] Starting execution for {task_id}")
             logger.warning(f"[EXEC] Plan type: {type(plan).__name__}")
             logger.warning(f"[EXEC] Plan has {len(plan.actions)} actions, {len(plan.folders_to_create)} folders")
@@ -104,25 +118,25 @@ async def execute(request: ExecuteRequest, background_tasks: BackgroundTasks):
                 logger.warning(f"[EXEC] First action: type={first.type}, source={first.source_path}, dest={first.destination_path}")
             
             # Broadcast start
-            await ws_manager.broadcast(WebSocketEvent(
-                event_type=EventType.EXECUTION_PROGRESS,
-                task_id=task_id,
-                message="Starting execution...",
-                data={"progress": 0}
-            ))
+            if ws_manager.has_subscribers:
+                event_type, message, data = _EXECUTION_STARTED
+                await ws_manager.broadcast_batched(
+                    build_event_payload(event_type, task_id, message, data)
+                )
             
             # Call the REAL executor directly — no pipeline, no class wrapper
-            result = do_execute(plan=plan)
+            result = await asyncio.get_running_loop().run_in_executor(EXEC_POOL, do_execute, plan)
             
             logger.warning(f"[EXEC] Result: succeeded={result.successful_actions}, failed={result.failed_actions}, error={result.error_message}")
             
             # Broadcast complete
-            await ws_manager.broadcast(WebSocketEvent(
-                event_type=EventType.TASK_COMPLETED,
-                task_id=task_id,
-                message=f"Execution completed: {result.successful_actions} succeeded, {result.failed_actions} failed",
-                data={"result": {"success": result.successful_actions, "failed": result.failed_actions, "error": result.error_message}, "progress": 100}
-            ))
+            if ws_manager.has_subscribers:
+                await ws_manager.broadcast(WebSocketEvent(
+                    event_type=EventType.TASK_COMPLETED,
+                    task_id=task_id,
+                    message=f"Execution completed: {result.successful_actions} succeeded, {result.failed_actions} failed",
+                    data={"result": {"success": result.successful_actions, "failed": result.failed_actions, "error": result.error_message}, "progress": 100}
+                ))
             
             # Update store
             save_task(task_id, {"state": TaskState.COMPLETED, "result": {"success": result.successful_actions, "failed": result.failed_actions}})
@@ -131,12 +145,13 @@ async def execute(request: ExecuteRequest, background_tasks: BackgroundTasks):
             import traceback
             logger.error(f"[EXEC] Execution FAILED: {e}")
             logger.error(f"[EXEC] Traceback: {traceback.format_exc()}")
-            await ws_manager.broadcast(WebSocketEvent(
-                event_type=EventType.TASK_FAILED,
-                task_id=task_id,
-                message=f"Execution failed: {str(e)}",
-                data={"error": str(e)}
-            ))
+            if ws_manager.has_subscribers:
+                await ws_manager.broadcast(WebSocketEvent(
+                    event_type=EventType.TASK_FAILED,
+                    task_id=task_id,
+                    message=f"Execution failed: {str(e)}",
+                    data={"error": str(e)}
+                ))
             save_task(task_id, {"state": TaskState.FAILED, "error": str(e)})
 
     # Start execution in background
@@ -8,15 +8,30 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException
 from ..models.requests import ScanRequest
 from ..models.responses import ScanResponse
 from ..websocket.manager import ws_manager
+from ..background import GatherBackgroundRoute
 from sentinel_core.scanner import scan_directory
 from sentinel_core.models.enums import TaskState
+import asyncio
+import os
 import uuid
 from datetime import datetime
+from operator import attrgetter
 import logging
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=GatherBackgroundRoute)
+
+
+def _scan_with_total_size(path: str, on_progress=None):
+    """
+    Scan a directory and total its file sizes in the same worker thread.
+    
+    Returns:
+        Tuple of (ScanResult, total size in bytes)
+    """
+    result = scan_directory(path, on_progress=on_progress)
+    return result, sum(map(attrgetter("size_bytes"), result.files))
 
 
 async def perform_scan(scan_id: str, path: str, max_depth: int):
@@ -28,66 +43,69 @@ async def perform_scan(scan_id: str, path: str, max_depth: int):
         path: Directory path to scan
         max_depth: Maximum directory depth
     """
-    with open("/Users/Mystic/Desktop/trial and error/Sentinel/backend_debug.log", "a") as f:
-        f.write(f"DEBUG: perform_scan started for {scan_id} at {path}\n")
+    logger.debug(f"perform_scan started for {scan_id} at {path}")
     
-    import asyncio
-    from ..models.events import WebSocketEvent, EventType
+    from ..models.events import WebSocketEvent, EventType, build_event_payload
     
     try:
         # Broadcast scanning started
-        with open("/Users/Mystic/Desktop/trial and error/Sentinel/backend_debug.log", "a") as f:
-            f.write(f"DEBUG: Broadcasting SCANNING event for {scan_id}\n")
-            
-        await ws_manager.broadcast(WebSocketEvent(
-            event_type=EventType.SCANNING,
-            task_id=scan_id,
-            message=f"Scanning {path}",
-            data={"path": path, "max_depth": max_depth}
-        ))
+        if ws_manager.has_subscribers:
+            await ws_manager.broadcast(WebSocketEvent(
+                event_type=EventType.SCANNING,
+                task_id=scan_id,
+                message=f"Scanning {path}",
+                data={"path": path, "max_depth": max_depth}
+            ))
         
         # Perform scan in thread pool to prevent blocking
-        with open("/Users/Mystic/Desktop/trial and error/Sentinel/backend_debug.log", "a") as f:
-            f.write(f"DEBUG: Starting scan_directory in thread for {scan_id}\n")
-            
-        result = await asyncio.to_thread(scan_directory, path)
+        # The scanner thread reports running counts back onto the loop, where
+        # they are queued as coalesced SCAN_PROGRESS events
+        loop = asyncio.get_running_loop()
+        
+        def queue_progress(files_scanned: int):
+            if ws_manager.has_subscribers:
+                ws_manager.queue_progress(build_event_payload(
+                    EventType.SCAN_PROGRESS,
+                    scan_id,
+                    f"Scanned {files_scanned} files",
+                    {"files_scanned": files_scanned}
+                ))
         
-        with open("/Users/Mystic/Desktop/trial and error/Sentinel/backend_debug.log", "a") as f:
-            f.write(f"DEBUG: scan_directory completed for {scan_id}. Found {len(result.files)} files.\n")
+        def report_progress(files_scanned: int):
+            loop.call_soon_threadsafe(queue_progress, files_scanned)
         
+        # Totals are summed off the loop too; large trees have millions of files
+        result, total_size = await asyncio.to_thread(
+            _scan_with_total_size, path, report_progress
+        )
+        # Don't let a late progress frame follow SCAN_COMPLETE
+        ws_manager.discard_progress(scan_id)
         total_files = len(result.files)
-        total_size = sum(f.size_bytes for f in result.files)
         
         # Broadcast complete
-        with open("/Users/Mystic/Desktop/trial and error/Sentinel/backend_debug.log", "a") as f:
-            f.write(f"DEBUG: Broadcasting SCAN_COMPLETE event for {scan_id}\n")
-            
-        await ws_manager.broadcast(WebSocketEvent(
-            event_type=EventType.SCAN_COMPLETE,
-            task_id=scan_id,
-            message=f"Scan complete: {total_files} files found",
-            data={
-                "total_files": total_files,
-                "total_size_bytes": total_size,
-                "errors": len(result.errors) if result.errors else 0
-            }
-        ))
+        if ws_manager.has_subscribers:
+            await ws_manager.broadcast(WebSocketEvent(
+                event_type=EventType.SCAN_COMPLETE,
+                task_id=scan_id,
+                message=f"Scan complete: {total_files} files found",
+                data={
+                    "total_files": total_files,
+                    "total_size_bytes": total_size,
+                    "errors": len(result.errors) if result.errors else 0
+                }
+            ))
         
         logger.info(f"Scan complete: {scan_id} - {total_files} files")
         
     except Exception as e:
-        with open("/Users/Mystic/Desktop/trial and error/Sentinel/backend_debug.log", "a") as f:
-            f.write(f"DEBUG: ERROR in perform_scan: {e}\n")
-            import traceback
-            traceback.print_exc(file=f)
-            
-        logger.error(f"Scan failed: {scan_id} - {e}")
-        await ws_manager.broadcast(WebSocketEvent(
-            event_type=EventType.ERROR,
-            task_id=scan_id,
-            message=f"Scan failed: {str(e)}",
-            data={"error_type": type(e).__name__}
-        ))
+        logger.error(f"Scan failed: {scan_id} - {e}", exc_info=True)
+        if ws_manager.has_subscribers:
+            await ws_manager.broadcast(WebSocketEvent(
+                event_type=EventType.ERROR,
+                task_id=scan_id,
+                message=f"Scan failed: {str(e)}",
+                data={"error_type": type(e).__name__}
+            ))
 
 
 @router.post("/scan", response_model=ScanResponse)
@@ -114,9 +132,9 @@ async def scan(request: ScanRequest, background_tasks: BackgroundTasks):
     """
     scan_id = f"scan-{uuid.uuid4()}"
     
-    # Validate path exists
-    from pathlib import Path
-    if not Path(request.path).exists():
+    # Validate the scan root; stat off the loop since it may sit on a slow or
+    # sleeping (network, external) volume
+    if not await asyncio.to_thread(os.path.isdir, request.path):
         raise HTTPException(status_code=404, detail=f"Path not found: {request.path}")
     
     # Start scan in background
@@ -6,14 +6,19 @@ Endpoints for listing and retrieving task details.
 
 from fastapi import APIRouter, HTTPException
 from ..models.responses import TaskListResponse, TaskDetailResponse, TaskListItem
+# Aliased: this module's detail endpoint is itself named get_task
+from ..memory import get_task as load_task, get_plan_json, list_recent_task_ids, task_count
 from sentinel_core.models.enums import TaskState
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Reported for tasks stored without a creation time
+_UNKNOWN_CREATED_AT = datetime.fromtimestamp(0, tz=timezone.utc)
+
 
 @router.get("/tasks", response_model=TaskListResponse)
 async def list_tasks(limit: int = 100, offset: int = 0):
@@ -30,30 +35,25 @@ async def list_tasks(limit: int = 100, offset: int = 0):
     Example:
         GET /api/tasks?limit=10&offset=0
     """
-    # Load from memory store
-    from ..memory import task_store
-    
     logger.info(f"Tasks list requested (limit={limit}, offset={offset})")
     
     tasks = []
-    # Sort by timestamp (if available) or insertion order (reversed)
-    sorted_ids = sorted(task_store.keys(), reverse=True)
-    
-    for task_id in sorted_ids[offset:offset+limit]:
-        data = task_store[task_id]
+    # Newest first, in creation order
+    for task_id in list_recent_task_ids(offset, limit):
+        data = load_task(task_id)
         # Construct TaskListItem from stored data
         # Note: This is a simplification. Real implementation would map fields.
         tasks.append(TaskListItem(
             task_id=task_id,
             state=data.get("state", TaskState.SCANNING), # Default to scanning if state missing
-            created_at=datetime.utcnow(), # Placeholder timestamp
+            created_at=data.get("created_at", _UNKNOWN_CREATED_AT),
             summary=data.get("summary", "Task in progress") if isinstance(data.get("summary"), str) else "Task in progress",
             total_files=data.get("summary", {}).get("total_files", 0) if isinstance(data.get("summary"), dict) else 0
         ))
     
     return TaskListResponse(
         tasks=tasks,
-        total=len(task_store)
+        total=task_count()
     )
 
 
@@ -74,12 +74,10 @@ async def get_task(task_id: str):
     Example:
         GET /api/tasks/task-abc-123
     """
-    # Load from memory store
-    from ..memory import get_task
-    
     logger.info(f"Task detail requested: {task_id}")
     
-    task_data = get_task(task_id)
+    # Load from memory store
+    task_data = load_task(task_id)
     
     if not task_data:
         raise HTTPException(
@@ -92,8 +90,8 @@ async def get_task(task_id: str):
     return TaskDetailResponse(
         task_id=task_id,
         state=task_data.get("state", TaskState.SCANNING),
-        created_at=datetime.utcnow(), # Placeholder
-        plan=task_data.get("plan"),
+        created_at=task_data.get("created_at", _UNKNOWN_CREATED_AT),
+        plan=get_plan_json(task_id),
         summary=task_data.get("summary") if isinstance(task_data.get("summary"), dict) else {},
         result=task_data.get("result")
     )
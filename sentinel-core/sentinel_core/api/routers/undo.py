@@ -56,7 +56,7 @@ async def undo(request: UndoRequest):
     
     logger.info(f"Undo requested (pending integration): {request.task_id}")
     
-    await ws_manager.broadcast({
+    await ws_manager.broadcast_batched({
         "event_type": "EXECUTING",
         "task_id": request.task_id,
         "message": "Undo in progress",
@@ -66,7 +66,9 @@ async def websocket_endpoint(websocket: WebSocket):
         # Client can send messages, but we primarily broadcast to them
         while True:
             data = await websocket.receive_text()
-            logger.debug(f"WebSocket received from {client_id}: {data}")
+            # Messages are only logged, so skip formatting them unless debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"WebSocket received from {client_id}: {data}")
             
             # Optional: Handle client messages (e.g., subscriptions, filters)
             # For now, we just keep the connection alive
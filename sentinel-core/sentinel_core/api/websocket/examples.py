@@ -6,7 +6,7 @@ This file demonstrates how to emit WebSocket events from the backend.
 
 import asyncio
 from sentinel_core.api.websocket.manager import ws_manager
-from sentinel_core.api.models.events import EventType
+from sentinel_core.api.models.events import EventType, build_event_payload
 
 # Example usage in a task handler
 
@@ -29,10 +29,11 @@ async def example_task_flow(task_id: str, path: str):
         }
     )
     
-    # 2. Scanning Progress (multiple updates)
+    # 2. Scanning Progress (multiple updates, coalesced by the manager so
+    #    rapid updates don't each become a frame)
     total_files = 100
     for i in range(0, total_files, 10):
-        await ws_manager.broadcast_task_event(
+        ws_manager.queue_progress(build_event_payload(
             EventType.SCAN_PROGRESS,
             task_id,
             f"Scanning... ({i}/{total_files} files)",
@@ -42,8 +43,9 @@ async def example_task_flow(task_id: str, path: str):
                 "total_size": i * 1024,
                 "progress": int((i / total_files) * 100)
             }
-        )
+        ))
         await asyncio.sleep(0.1)  # Simulate work
+    ws_manager.discard_progress(task_id)
     
     # 3. Plan Ready
     plan = {
@@ -5,16 +5,44 @@ Manages WebSocket connections with connection tracking, heartbeat, and event bro
 """
 
 from fastapi import WebSocket
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple, Union
 import asyncio
+import json
 import logging
 import uuid
 from datetime import datetime
 
-from ..models.events import WebSocketEvent, EventType, ConnectionEvent, HeartbeatEvent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..models.events import (
+    WebSocketEvent, EventType, ConnectionEvent, build_event_payload, json_default
+)
 
 logger = logging.getLogger(__name__)
 
+# Clients sent to concurrently before yielding back to the event loop
+BROADCAST_BATCH_SIZE = 50
+# Seconds a single client send may take before that client is dropped
+SEND_TIMEOUT = 5.0
+# Seconds between progress flushes; updates in between are coalesced
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    """
+    Serialize a payload to compact JSON text, with orjson when available.
+    
+    Both paths produce the same text, matching WebSocketEvent.to_json().
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=json_default).decode()
+    return json.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False, default=json_default
+    )
+
 
 class WebSocketManager:
     """
@@ -31,8 +59,18 @@ class WebSocketManager:
     def __init__(self):
         # Active connections mapped by client ID
         self.active_connections: Dict[str, WebSocket] = {}
+        # Copy-on-write view of active_connections, replaced under the lock
+        # whenever a client joins or leaves; broadcasts read it lock-free
+        self._snapshot: Tuple[Tuple[str, WebSocket], ...] = ()
         self._lock = asyncio.Lock()
         self._heartbeat_task: Optional[asyncio.Task] = None
+        # Latest unsent progress payload per task, flushed by _progress_loop
+        self._pending_progress: Dict[str, Dict[str, Any]] = {}
+        # Tasks discarded since the loop took its current batch; their
+        # already-taken payloads must not be sent
+        self._discarded_progress: Set[str] = set()
+        self._progress_ready = asyncio.Event()
+        self._progress_task: Optional[asyncio.Task] = None
         logger.info("WebSocketManager initialized")
     
     async def startup(self):
@@ -48,18 +86,23 @@ class WebSocketManager:
         """Called on server shutdown - closes all connections."""
         logger.info("WebSocketManager shutting down...")
         
-        # Cancel heartbeat
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel heartbeat and progress flushing
+        for task in (self._heartbeat_task, self._progress_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._progress_task = None
+        self._pending_progress.clear()
+        self._discarded_progress.clear()
         
         # Close all connections
         async with self._lock:
             connections = list(self.active_connections.values())
             self.active_connections.clear()
+            self._snapshot = ()
         
         for connection in connections:
             try:
@@ -87,6 +130,7 @@ class WebSocketManager:
         
         async with self._lock:
             self.active_connections[client_id] = websocket
+            self._snapshot = tuple(self.active_connections.items())
         
         logger.info(f"Client {client_id} connected. Total: {len(self.active_connections)}")
         
@@ -109,6 +153,7 @@ class WebSocketManager:
         async with self._lock:
             if client_id in self.active_connections:
                 del self.active_connections[client_id]
+                self._snapshot = tuple(self.active_connections.items())
         
         logger.info(f"Client {client_id} disconnected. Total: {len(self.active_connections)}")
     
@@ -127,7 +172,7 @@ class WebSocketManager:
         websocket = self.active_connections[client_id]
         
         try:
-            await websocket.send_text(event.json())
+            await websocket.send_text(event.to_json())
             logger.debug(f"Sent {event.event_type} to client {client_id}")
         except Exception as e:
             logger.error(f"Error sending to client {client_id}: {e}")
@@ -144,26 +189,147 @@ class WebSocketManager:
             logger.debug("No active connections to broadcast to")
             return
         
-        dead_clients = []
+        sent = await self._send_to_all(event.to_json())
+        logger.debug(f"Broadcast {event.event_type} to {sent} clients")
+    
+    async def broadcast_batched(self, payload: Dict[str, Any]):
+        """
+        Broadcast a plain JSON-serializable payload to all connected clients.
         
-        # Get snapshot of connections
-        async with self._lock:
-            connections = dict(self.active_connections)
+        Args:
+            payload: Event payload (event_type, task_id, message, data)
+        """
+        if not self.active_connections:
+            logger.debug("No active connections to broadcast to")
+            return
+        
+        sent = await self._send_to_all(_dumps(payload))
+        logger.debug(f"Broadcast {payload.get('event_type')} to {sent} clients")
+    
+    async def broadcast_raw(self, payload: Union[bytes, str]):
+        """
+        Broadcast an already-serialized event to all connected clients.
+        
+        Use this when the caller has the JSON at hand (e.g. a cached plan
+        event) so it isn't serialized again here.
+        
+        Args:
+            payload: JSON event as UTF-8 bytes or text
+        """
+        if not self.active_connections:
+            logger.debug("No active connections to broadcast to")
+            return
+        
+        # Text frames: the web client JSON.parses event.data directly
+        text = payload.decode() if isinstance(payload, bytes) else payload
+        sent = await self._send_to_all(text)
+        logger.debug(f"Broadcast raw payload ({len(text)} chars) to {sent} clients")
+    
+    def queue_progress(self, payload: Dict[str, Any]):
+        """
+        Queue a progress event, coalescing rapid updates per task.
         
-        # Broadcast to all
-        for client_id, websocket in connections.items():
+        At most one progress frame per task is sent every
+        PROGRESS_FLUSH_INTERVAL seconds, carrying the latest payload queued
+        for that task. Must be called from the event loop thread.
+        
+        Args:
+            payload: Event payload from build_event_payload, with a task_id
+        """
+        self._pending_progress[payload["task_id"]] = payload
+        self._progress_ready.set()
+        if self._progress_task is None or self._progress_task.done():
+            self._progress_task = asyncio.create_task(self._progress_loop())
+    
+    def discard_progress(self, task_id: str):
+        """
+        Drop a task's unsent progress, e.g. before sending its final event.
+        
+        This also covers a payload the flush loop has already taken but not
+        sent yet, so no progress frame follows the task's final event.
+        
+        Args:
+            task_id: Task whose pending progress to drop
+        """
+        self._pending_progress.pop(task_id, None)
+        self._discarded_progress.add(task_id)
+    
+    async def _progress_loop(self):
+        """Flush coalesced progress events at most every PROGRESS_FLUSH_INTERVAL."""
+        while True:
             try:
-                await websocket.send_text(event.json())
+                await self._progress_ready.wait()
+                self._progress_ready.clear()
+                pending, self._pending_progress = self._pending_progress, {}
+                # Earlier discards already removed their payloads from this batch
+                self._discarded_progress.clear()
+                for task_id, payload in pending.items():
+                    # Checked before every send: a task can finish while the
+                    # frames ahead of it are being sent
+                    if task_id not in self._discarded_progress:
+                        await self.broadcast_batched(payload)
+                await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+            except asyncio.CancelledError:
+                break
             except Exception as e:
-                logger.warning(f"Failed to send to client {client_id}: {e}")
-                dead_clients.append(client_id)
+                logger.error(f"Error in progress loop: {e}")
+    
+    async def _send_to_all(self, text: str) -> int:
+        """
+        Send pre-serialized text to every connected client.
+        
+        Clients are sent to concurrently in batches of BROADCAST_BATCH_SIZE,
+        yielding to the event loop between batches so a large fan-out doesn't
+        starve HTTP handlers. Clients whose send fails or takes longer than
+        SEND_TIMEOUT are disconnected.
+        
+        Args:
+            text: Serialized event
+            
+        Returns:
+            int: Number of clients the broadcast was attempted to
+        """
+        dead_clients = []
+        
+        # Immutable snapshot; no lock needed to read it
+        connections = self._snapshot
+        
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            if start:
+                await asyncio.sleep(0)
+            # _safe_send never raises; cancelling the broadcast cancels the batch
+            async with asyncio.TaskGroup() as tg:
+                sends = [
+                    tg.create_task(self._safe_send(client_id, websocket, text))
+                    for client_id, websocket in batch
+                ]
+            dead_clients.extend(
+                client_id for (client_id, _), send in zip(batch, sends)
+                if not send.result()
+            )
         
         # Clean up dead connections
-        if dead_clients:
-            for client_id in dead_clients:
-                await self.disconnect(client_id)
+        for client_id in dead_clients:
+            await self.disconnect(client_id)
+        
+        return len(connections)
+    
+    async def _safe_send(self, client_id: str, websocket: WebSocket, text: str) -> bool:
+        """
+        Send text to one client, bounded by SEND_TIMEOUT.
         
-        logger.debug(f"Broadcast {event.event_type} to {len(connections)} clients")
+        Returns:
+            bool: False if the send failed or timed out
+        """
+        try:
+            await asyncio.wait_for(websocket.send_text(text), timeout=SEND_TIMEOUT)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Send to client {client_id} timed out after {SEND_TIMEOUT}s")
+        except Exception as e:
+            logger.warning(f"Failed to send to client {client_id}: {e}")
+        return False
     
     async def broadcast_task_event(
         self,
@@ -181,13 +347,10 @@ class WebSocketManager:
             message: Optional message
             data: Optional additional data
         """
-        event = WebSocketEvent(
-            event_type=event_type,
-            task_id=task_id,
-            message=message,
-            data=data or {}
+        # Plain payload: same wire form as WebSocketEvent, without validation
+        await self.broadcast_batched(
+            build_event_payload(event_type, task_id, message, data)
         )
-        await self.broadcast(event)
     
     async def _heartbeat_loop(self):
         """Send periodic heartbeats to keep connections alive."""
@@ -195,14 +358,25 @@ class WebSocketManager:
             try:
                 await asyncio.sleep(30)  # Every 30 seconds
                 
-                event = HeartbeatEvent(message="ping")
-                await self.broadcast(event)
+                # Idle server: nothing to build or send
+                if not self._snapshot:
+                    continue
+                
+                # Serialized once per cycle, then shared by every client
+                await self.broadcast_batched(
+                    build_event_payload(EventType.HEARTBEAT, message="ping")
+                )
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in heartbeat loop: {e}")
     
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether any client is connected; lets callers skip building events."""
+        return bool(self._snapshot)
+    
     def get_connection_count(self) -> int:
         """Get number of active connections."""
         return len(self.active_connections)
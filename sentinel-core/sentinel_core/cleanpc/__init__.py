@@ -5,12 +5,15 @@ Intelligent file cleanup and organization pipeline.
 """
 
 from sentinel_core.cleanpc.pipeline import CleanPCPipeline
-from sentinel_core.cleanpc.classifiers import FileClassifier, FileClassification
+from sentinel_core.cleanpc.classifiers import FileCategory, FileClassifier, FileClassification
+from sentinel_core.cleanpc.hash_cache import HashCache
 from sentinel_core.cleanpc.rules import OrganizationRules
 
 __all__ = [
     "CleanPCPipeline",
+    "FileCategory",
     "FileClassifier",
     "FileClassification",
+    "HashCache",
     "OrganizationRules",
 ]
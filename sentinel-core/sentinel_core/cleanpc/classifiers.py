@@ -5,13 +5,48 @@ Intelligent detection of file types and categories for cleanup.
 """
 
 import hashlib
+import logging
+import os
+import re
+import sqlite3
+from collections import Counter
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
-from pathlib import Path
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 from sentinel_core.models.filesystem import FileMetadata
 from sentinel_core.models.enums import FileType
+from sentinel_core.cleanpc.hash_cache import HashCache
+
+logger = logging.getLogger(__name__)
+
+# Content hash used for duplicate detection, and its name in the hash cache
+_HASH_ALGORITHM = xxhash.xxh3_128 if xxhash is not None else 'sha256'
+_HASH_ALGORITHM_NAME = 'xxh3_128' if xxhash is not None else 'sha256'
+
+
+def _digest_bytes(data: bytes) -> str:
+    """Hash an in-memory buffer with the duplicate-detection algorithm."""
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+class FileCategory(IntEnum):
+    """Which heuristic classified a file; at most one applies."""
+    NONE = 0
+    INSTALLER = 1
+    ARCHIVE = 2
+    LARGE_VIDEO = 3
+    SCREENSHOT = 4
+    DUPLICATE = 5
 
 
 @dataclass
@@ -31,6 +66,7 @@ class FileClassification:
         suggested_action: Recommended action (move, delete, etc.)
         suggested_target: Target path for move operations
         age_days: Age of file in days
+        category: The heuristic that matched, for table lookups
     """
     file: FileMetadata
     is_installer: bool = False
@@ -43,6 +79,7 @@ class FileClassification:
     suggested_action: Optional[str] = None
     suggested_target: Optional[str] = None
     age_days: int = 0
+    category: FileCategory = FileCategory.NONE
 
 
 class FileClassifier:
@@ -51,9 +88,9 @@ class FileClassifier:
     """
     
     # File extension sets
-    INSTALLER_EXTENSIONS = {'.dmg', '.pkg', '.exe', '.msi', '.app'}
-    ARCHIVE_EXTENSIONS = {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.tar.gz', '.tgz'}
-    VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv', '.m4v'}
+    INSTALLER_EXTENSIONS = frozenset({'.dmg', '.pkg', '.exe', '.msi', '.app'})
+    ARCHIVE_EXTENSIONS = frozenset({'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.tar.gz', '.tgz'})
+    VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv', '.m4v'})
     
     # Screenshot patterns
     SCREENSHOT_PATTERNS = [
@@ -64,16 +101,28 @@ class FileClassifier:
         'capture',
         'img_',  # Common phone pattern
     ]
+    _SCREENSHOT_RE = re.compile('|'.join(map(re.escape, SCREENSHOT_PATTERNS)))
     
     # Thresholds
     INSTALLER_AGE_THRESHOLD_DAYS = 30
     OLD_ARCHIVE_THRESHOLD_DAYS = 730  # 2 years
     LARGE_VIDEO_THRESHOLD_BYTES = 100 * 1024 * 1024  # 100MB
     HASH_SIZE_LIMIT_BYTES = 100 * 1024 * 1024  # Don't hash files > 100MB
+    # Bytes read from each end of a file to rule out duplicates cheaply
+    SAMPLE_BYTES = 4096
+    # Hashing threads; reads and SHA256 updates both release the GIL
+    HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
     
-    def __init__(self):
-        """Initialize the file classifier."""
+    def __init__(self, hash_cache: Optional[HashCache] = None):
+        """
+        Initialize the file classifier.
+        
+        Args:
+            hash_cache: Optional persistent cache so unchanged files aren't
+                re-hashed on later runs
+        """
         self._hash_cache: Dict[str, str] = {}
+        self._persistent_cache = hash_cache
     
     def classify_all(self, files: List[FileMetadata]) -> List[FileClassification]:
         """
@@ -85,21 +134,36 @@ class FileClassifier:
         Returns:
             List of file classifications
         """
-        classifications = []
+        return list(self.iter_classify(files))
+    
+    def iter_classify(self, files: List[FileMetadata]) -> Iterator[FileClassification]:
+        """
+        Classify files one at a time, in order.
         
+        Duplicate hashing still covers the whole list up front; the
+        per-file classifications are then yielded as they are made, so a
+        caller can process each one in the same pass.
+        
+        Args:
+            files: List of file metadata to classify
+            
+        Yields:
+            File classifications
+        """
         # Build hash map for duplicate detection
         hash_map = self._build_hash_map(files)
         
-        for file in files:
-            classification = self._classify_file(file, hash_map)
-            classifications.append(classification)
+        # One reference time for the whole batch
+        now = datetime.now()
         
-        return classifications
+        for file in files:
+            yield self._classify_file(file, hash_map, now)
     
     def _classify_file(
         self, 
         file: FileMetadata, 
-        hash_map: Dict[str, List[FileMetadata]]
+        hash_map: Dict[str, List[FileMetadata]],
+        now: datetime
     ) -> FileClassification:
         """
         Classify a single file.
@@ -107,11 +171,14 @@ class FileClassifier:
         Args:
             file: File metadata
             hash_map: Map of file hashes to file lists (for duplicates)
+            now: Reference time for file ages
             
         Returns:
             File classification
         """
-        age_days = (datetime.now() - file.modified_at).days
+        age_days = (now - file.modified_at).days
+        # Name of the containing folder, parsed once for all checks
+        parent_dir = os.path.basename(os.path.dirname(file.path)).lower()
         
         classification = FileClassification(
             file=file,
@@ -121,8 +188,9 @@ class FileClassifier:
         # Check each classification (order matters for priority)
         
         # 1. Check if installer
-        if self._is_installer(file, age_days):
+        if self._is_installer(file, age_days, parent_dir):
             classification.is_installer = True
+            classification.category = FileCategory.INSTALLER
             classification.suggested_action = "delete"
             classification.suggested_target = "trash"
             return classification
@@ -130,13 +198,13 @@ class FileClassifier:
         # 2. Check if archive
         if self._is_archive(file):
             classification.is_archive = True
+            classification.category = FileCategory.ARCHIVE
             classification.suggested_action = "move"
             year = file.modified_at.year
             classification.suggested_target = f"~/Archives/{year}/"
             
             # Suggest delete for very old archives in Downloads
             if age_days > self.OLD_ARCHIVE_THRESHOLD_DAYS:
-                parent_dir = Path(file.path).parent.name.lower()
                 if parent_dir == 'downloads':
                     classification.suggested_action = "delete"
                     classification.suggested_target = "trash"
@@ -146,6 +214,7 @@ class FileClassifier:
         # 3. Check if large video
         if self._is_large_video(file):
             classification.is_large_video = True
+            classification.category = FileCategory.LARGE_VIDEO
             classification.video_size_mb = file.size_bytes // (1024 * 1024)
             classification.suggested_action = "move"
             year = file.modified_at.year
@@ -153,8 +222,9 @@ class FileClassifier:
             return classification
         
         # 4. Check if screenshot
-        if self._is_screenshot(file):
+        if self._is_screenshot(file, now, parent_dir):
             classification.is_screenshot = True
+            classification.category = FileCategory.SCREENSHOT
             classification.suggested_action = "move"
             year = file.created_at.year
             classification.suggested_target = f"~/Pictures/Screenshots/{year}/"
@@ -169,6 +239,7 @@ class FileClassifier:
                 newest = max(duplicates, key=lambda f: f.modified_at)
                 if file.path != newest.path:
                     classification.is_duplicate = True
+                    classification.category = FileCategory.DUPLICATE
                     classification.duplicate_of = newest.path
                     classification.suggested_action = "delete"
                     classification.suggested_target = "trash"
@@ -176,7 +247,7 @@ class FileClassifier:
         
         return classification
     
-    def _is_installer(self, file: FileMetadata, age_days: int) -> bool:
+    def _is_installer(self, file: FileMetadata, age_days: int, parent_dir: str) -> bool:
         """
         Detect installer files.
         
@@ -188,12 +259,13 @@ class FileClassifier:
         Args:
             file: File metadata
             age_days: Age of file in days
+            parent_dir: Lowercased name of the containing folder
             
         Returns:
             True if file is an old installer
         """
         # Check extension
-        if file.extension.lower() not in self.INSTALLER_EXTENSIONS:
+        if file.extension not in self.INSTALLER_EXTENSIONS:
             return False
         
         # Check age
@@ -201,7 +273,6 @@ class FileClassifier:
             return False
         
         # Check location (Downloads or Desktop)
-        parent_dir = Path(file.path).parent.name.lower()
         if parent_dir not in ['downloads', 'desktop']:
             return False
         
@@ -217,7 +288,7 @@ class FileClassifier:
         Returns:
             True if file is an archive
         """
-        return file.extension.lower() in self.ARCHIVE_EXTENSIONS
+        return file.extension in self.ARCHIVE_EXTENSIONS
     
     def _is_large_video(self, file: FileMetadata) -> bool:
         """
@@ -229,12 +300,12 @@ class FileClassifier:
         Returns:
             True if file is a large video
         """
-        if file.extension.lower() not in self.VIDEO_EXTENSIONS:
+        if file.extension not in self.VIDEO_EXTENSIONS:
             return False
         
         return file.size_bytes > self.LARGE_VIDEO_THRESHOLD_BYTES
     
-    def _is_screenshot(self, file: FileMetadata) -> bool:
+    def _is_screenshot(self, file: FileMetadata, now: datetime, parent_dir: str) -> bool:
         """
         Detect screenshots.
         
@@ -244,30 +315,30 @@ class FileClassifier:
         
         Args:
             file: File metadata
+            now: Reference time for file age
+            parent_dir: Lowercased name of the containing folder
             
         Returns:
             True if file appears to be a screenshot
         """
         name_lower = file.name.lower()
         
-        # Check filename patterns
-        for pattern in self.SCREENSHOT_PATTERNS:
-            if pattern in name_lower:
-                return True
+        # Check filename patterns (one regex scan instead of a loop)
+        if self._SCREENSHOT_RE.search(name_lower):
+            return True
         
         # macOS default pattern: "Screen Shot YYYY-MM-DD at HH.MM.SS.png"
-        if name_lower.startswith('screen ') and file.extension.lower() in ['.png', '.jpg']:
+        if name_lower.startswith('screen ') and file.extension in ['.png', '.jpg']:
             return True
         
         # Windows default pattern: "Screenshot (N).png"
-        if name_lower.startswith('screenshot (') and file.extension.lower() == '.png':
+        if name_lower.startswith('screenshot (') and file.extension == '.png':
             return True
         
         # Additional heuristic: Recent images in Downloads/Desktop
         if file.file_type == FileType.IMAGE:
-            parent_dir = Path(file.path).parent.name.lower()
             if parent_dir in ['downloads', 'desktop']:
-                age_days = (datetime.now() - file.created_at).days
+                age_days = (now - file.created_at).days
                 # Images created within last 6 months in Downloads/Desktop
                 # are likely screenshots
                 if age_days < 180:
@@ -282,7 +353,12 @@ class FileClassifier:
         """
         Build a hash map for duplicate detection.
         
-        Only hashes files under the size limit to avoid performance issues.
+        Only hashes files under the size limit to avoid performance issues,
+        and only files that share their size with another file: a file with
+        a unique size can't be a duplicate, so it is never read. Within a
+        size group, larger files are first compared by a head/tail sample
+        and only fully hashed if the sample matches another file's. Hashes
+        of unchanged files come from the persistent cache when one is set.
         
         Args:
             files: List of files to hash
@@ -292,34 +368,189 @@ class FileClassifier:
         """
         hash_map: Dict[str, List[FileMetadata]] = {}
         
-        # Only hash reasonably-sized files
-        hashable_files = [
-            f for f in files 
-            if f.size_bytes < self.HASH_SIZE_LIMIT_BYTES
-        ]
+        # Group reasonably-sized files by size
+        size_groups: Dict[int, List[FileMetadata]] = {}
+        for f in files:
+            if f.size_bytes < self.HASH_SIZE_LIMIT_BYTES:
+                size_groups.setdefault(f.size_bytes, []).append(f)
+        
+        candidate_groups = [group for group in size_groups.values() if len(group) > 1]
+        hashable_files = [f for group in candidate_groups for f in group]
+        
+        if not hashable_files:
+            return hash_map
+        
+        known = self._load_cached_hashes(hashable_files)
+        to_hash = self._prune_by_sample(candidate_groups, known)
+        
+        if to_hash:
+            hashes = self._map_files(self._try_compute_hash, to_hash)
+            computed = [
+                (file, file_hash) for file, file_hash in zip(to_hash, hashes)
+                if file_hash is not None
+            ]
+            known.update((file.path, file_hash) for file, file_hash in computed)
+            self._store_cached_hashes(computed)
         
         for file in hashable_files:
-            try:
-                file_hash = self._compute_hash(file.path)
-                self._hash_cache[file.path] = file_hash
-                
-                if file_hash in hash_map:
-                    hash_map[file_hash].append(file)
-                else:
-                    hash_map[file_hash] = [file]
-            except Exception:
-                # Skip files we can't hash
+            file_hash = known.get(file.path)
+            if file_hash is None:
                 continue
+            self._hash_cache[file.path] = file_hash
+            
+            if file_hash in hash_map:
+                hash_map[file_hash].append(file)
+            else:
+                hash_map[file_hash] = [file]
         
         return hash_map
     
-    def _compute_hash(self, filepath: str, chunk_size: int = 8192) -> str:
+    def _prune_by_sample(
+        self,
+        groups: List[List[FileMetadata]],
+        known: Dict[str, str]
+    ) -> List[FileMetadata]:
+        """
+        Pick the uncached files that may still be duplicates.
+        
+        Files in a size group larger than two samples are compared by a
+        digest of their first and last SAMPLE_BYTES; a file whose sample
+        matches no other file's is dropped without being fully read.
+        
+        Args:
+            groups: Files grouped by size, each with two or more files
+            known: Cached hashes by path
+            
+        Returns:
+            Files that need a full hash
+        """
+        to_hash: List[FileMetadata] = []
+        to_sample: List[FileMetadata] = []
+        
+        for group in groups:
+            uncached = [f for f in group if f.path not in known]
+            if not uncached:
+                continue
+            # Small files are read whole either way, and cached files have
+            # no sample to compare against, so hash those groups fully
+            if len(uncached) < len(group) or group[0].size_bytes <= 2 * self.SAMPLE_BYTES:
+                to_hash.extend(uncached)
+            else:
+                to_sample.extend(uncached)
+        
+        if to_sample:
+            samples = self._map_files(self._try_sample_hash, to_sample)
+            keys = [
+                (f.size_bytes, sample) for f, sample in zip(to_sample, samples)
+            ]
+            counts = Counter(key for key in keys if key[1] is not None)
+            to_hash.extend(
+                f for f, key in zip(to_sample, keys)
+                if key[1] is not None and counts[key] > 1
+            )
+        
+        return to_hash
+    
+    def _map_files(
+        self,
+        func: Callable[[FileMetadata], Optional[str]],
+        files: List[FileMetadata]
+    ) -> List[Optional[str]]:
+        """
+        Apply a hashing function to files on a thread pool.
+        
+        Args:
+            func: Function returning a hash or None for one file
+            files: Files to process
+            
+        Returns:
+            Results in the same order as files
+        """
+        workers = min(self.HASH_WORKERS, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, files))
+    
+    def _load_cached_hashes(self, files: List[FileMetadata]) -> Dict[str, str]:
+        """
+        Fetch persisted hashes for unchanged files.
+        
+        Args:
+            files: Files about to be hashed
+            
+        Returns:
+            Dictionary mapping file path to hash (empty without a cache)
+        """
+        if self._persistent_cache is None:
+            return {}
+        try:
+            return self._persistent_cache.get_many(files, _HASH_ALGORITHM_NAME)
+        except sqlite3.Error as e:
+            logger.warning(f"Hash cache lookup failed: {e}")
+            return {}
+    
+    def _store_cached_hashes(self, entries: List[Tuple[FileMetadata, str]]) -> None:
+        """
+        Persist newly computed hashes.
+        
+        Args:
+            entries: (file, hash) pairs
+        """
+        if self._persistent_cache is None or not entries:
+            return
+        try:
+            self._persistent_cache.put_many(entries, _HASH_ALGORITHM_NAME)
+        except sqlite3.Error as e:
+            logger.warning(f"Hash cache update failed: {e}")
+    
+    def _try_compute_hash(self, file: FileMetadata) -> Optional[str]:
+        """
+        Compute a file's hash, or None if it can't be read.
+        
+        Args:
+            file: File metadata
+            
+        Returns:
+            Hexadecimal hash string, or None on failure
+        """
+        try:
+            return self._compute_hash(file.path)
+        except Exception:
+            # Skip files we can't hash
+            return None
+    
+    def _try_sample_hash(self, file: FileMetadata) -> Optional[str]:
         """
-        Compute SHA256 hash of file.
+        Digest a file's first and last SAMPLE_BYTES, or None if unreadable.
+        
+        Args:
+            file: File metadata
+            
+        Returns:
+            Hexadecimal digest of the sample, or None on failure
+        """
+        try:
+            with open(file.path, 'rb') as f:
+                head = f.read(self.SAMPLE_BYTES)
+                f.seek(-self.SAMPLE_BYTES, os.SEEK_END)
+                tail = f.read(self.SAMPLE_BYTES)
+        except OSError:
+            return None
+        return _digest_bytes(head + tail)
+    
+    def _compute_hash(self, filepath: str) -> str:
+        """
+        Compute a content hash of file for duplicate detection.
+        
+        Uses xxHash3-128 when xxhash is installed (non-cryptographic, many
+        times faster than SHA256 and ample for grouping duplicates), else
+        SHA256. hashlib.file_digest reads the file in large blocks and hashes
+        them without returning to Python per chunk.
+        
+        The persistent hash cache records which algorithm produced each hash,
+        so installing or removing xxhash never mixes the two.
         
         Args:
             filepath: Path to file
-            chunk_size: Size of chunks to read (default 8KB)
             
         Returns:
             Hexadecimal hash string
@@ -327,10 +558,5 @@ class FileClassifier:
         Raises:
             IOError: If file cannot be read
         """
-        hasher = hashlib.sha256()
-        
         with open(filepath, 'rb') as f:
-            while chunk := f.read(chunk_size):
-                hasher.update(chunk)
-        
-        return hasher.hexdigest()
+            return hashlib.file_digest(f, _HASH_ALGORITHM).hexdigest()
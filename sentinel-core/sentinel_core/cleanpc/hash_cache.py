@@ -0,0 +1,85 @@
+"""
+Persistent File Hash Cache
+
+Remembers content hashes across runs so unchanged files aren't re-read
+during duplicate detection.
+"""
+
+import os
+from typing import Dict, Iterable, List, Tuple
+
+from sentinel_core.models.filesystem import FileMetadata
+from sentinel_core.scanner.sqlite_cache import DEFAULT_MAX_ENTRIES, FileKey, SQLiteKeyedCache
+
+# Default cache location, next to the preferences database
+DEFAULT_HASH_CACHE_PATH = os.path.expanduser("~/.sentinel/hash_cache.db")
+
+
+def _file_key(file: FileMetadata) -> FileKey:
+    """Fingerprint of a scanned file; FileMetadata keeps mtime to the microsecond."""
+    return file.path, round(file.modified_at.timestamp() * 1_000_000) * 1_000, file.size_bytes
+
+
+class HashCache(SQLiteKeyedCache):
+    """
+    SQLite-backed cache of file content hashes.
+
+    Entries are keyed by path and only reused while the file's size and
+    modification time still match, and only for the same hash algorithm.
+    The least recently used entries are evicted once the cache holds more
+    than max_entries.
+
+    A connection is opened per call, so one cache can be used from worker
+    threads (the pipeline classifies files in a thread).
+
+    Example:
+        >>> cache = HashCache()
+        >>> known = cache.get_many(files, "sha256")
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_HASH_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            max_entries: Row count above which old entries are evicted
+        """
+        super().__init__(
+            db_path,
+            "file_hashes",
+            {"algorithm": "TEXT NOT NULL", "hash": "TEXT NOT NULL"},
+            max_entries
+        )
+
+    def get_many(self, files: List[FileMetadata], algorithm: str) -> Dict[str, str]:
+        """
+        Look up cached hashes for files that haven't changed.
+
+        Args:
+            files: Files to look up
+            algorithm: Hash algorithm name the caller uses
+
+        Returns:
+            Dictionary mapping file path to hash, for cache hits only
+        """
+        hits = self._get_many(map(_file_key, files), "algorithm = ?", (algorithm,))
+        return {path: file_hash for path, (_, file_hash) in hits.items()}
+
+    def put_many(
+        self,
+        entries: Iterable[Tuple[FileMetadata, str]],
+        algorithm: str
+    ) -> None:
+        """
+        Store hashes for files, replacing older entries.
+
+        Args:
+            entries: (file, hash) pairs
+            algorithm: Hash algorithm name the hashes were computed with
+        """
+        self._put_many((_file_key(f), (algorithm, file_hash)) for f, file_hash in entries)
@@ -4,22 +4,44 @@ Clean My PC Pipeline
 Main orchestrator for the Clean My PC feature.
 """
 
+import asyncio
 import logging
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from sentinel_core.scanner.scanner import Scanner
 from sentinel_core.models.filesystem import ScanResult, FileMetadata
 from sentinel_core.models.preferences import PreferencesSchema
-from sentinel_core.cleanpc.classifiers import FileClassifier, FileClassification
+from sentinel_core.cleanpc.classifiers import FileCategory, FileClassifier, FileClassification
+from sentinel_core.cleanpc.hash_cache import HashCache
 from sentinel_core.cleanpc.rules import OrganizationRules
+from sentinel_core.rules.models import RuleMatchResult
 from sentinel_core.planner.planner_agent import PlannerAgent
-from sentinel_core.safety.safety import SafetyValidator
+from sentinel_core.safety.safety import SafetyValidator, ValidationCache
 from sentinel_core.executor import Executor
-from sentinel_core.models.planner import PlanSchema
+from sentinel_core.models.planner import PlanAction, PlanSchema
+from sentinel_core.models.enums import ActionType
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; the user's home doesn't change during a run
+_HOME = Path.home()
+_DEFAULT_DIR_NAMES = ("Downloads", "Desktop", "Documents", "Videos")
+
+# Classifier suggested_action -> plan action type for the fallback plan
+_ACTION_MAP = {"delete": ActionType.DELETE, "move": ActionType.MOVE}
+
+# Fallback plan action reasons by category, formatted with the classification as `c`
+_FALLBACK_REASONS = {
+    FileCategory.NONE: "Organization",
+    FileCategory.INSTALLER: "Old installer ({c.age_days} days)",
+    FileCategory.ARCHIVE: "Archive file",
+    FileCategory.LARGE_VIDEO: "Large video ({c.video_size_mb}MB)",
+    FileCategory.SCREENSHOT: "Screenshot",
+    FileCategory.DUPLICATE: "Duplicate file",
+}
+
 
 class CleanPCPipeline:
     """
@@ -40,7 +62,8 @@ class CleanPCPipeline:
         self,
         planner: PlannerAgent,
         safety: SafetyValidator,
-        executor: Executor
+        executor: Executor,
+        hash_cache: Optional[HashCache] = None
     ):
         """
         Initialize the pipeline.
@@ -49,11 +72,12 @@ class CleanPCPipeline:
             planner: Planner agent for generating organization plans
             safety: Safety validator for checking plans
             executor: Executor for carrying out approved operations
+            hash_cache: Optional persistent cache for duplicate detection hashes
         """
         self.planner = planner
         self.safety = safety
         self.executor = executor
-        self.classifier = FileClassifier()
+        self.classifier = FileClassifier(hash_cache=hash_cache)
         self.rules = OrganizationRules()
     
     async def scan_and_plan(
@@ -86,33 +110,21 @@ class CleanPCPipeline:
         
         # 1. Define target directories
         if target_dirs is None:
-            target_dirs = self._get_default_target_dirs()
+            target_dirs = await self._get_default_target_dirs()
         
         logger.info(f"Scanning directories: {target_dirs}")
         
-        # 2. Scan all directories
-        all_files: List[FileMetadata] = []
-        scan_errors: List[str] = []
-        
-        for dir_path in target_dirs:
-            try:
-                scanner = Scanner(dir_path, max_depth=max_depth)
-                scan_result = scanner.scan()
-                all_files.extend(scan_result.files)
-                scan_errors.extend(scan_result.errors)
-            except Exception as e:
-                logger.error(f"Failed to scan {dir_path}: {e}")
-                scan_errors.append(f"Failed to scan {dir_path}: {str(e)}")
+        # 2. Scan all directories concurrently, each walk in its own thread
+        all_files, scan_errors = await self._scan_directories(target_dirs, max_depth)
         
         logger.info(f"Scanned {len(all_files)} files")
         
-        # 3. Classify files
-        logger.info("Classifying files...")
-        classifications = self.classifier.classify_all(all_files)
-        
-        # 4. Apply organization rules
-        logger.info("Applying organization rules...")
-        rule_matches = self.rules.apply_rules(classifications)
+        # 3. Classify files and 4. apply organization rules (CPU-bound, and
+        # classification may hash file contents)
+        logger.info("Classifying files and applying organization rules...")
+        classifications, rule_matches = await asyncio.to_thread(
+            self._classify_and_match, all_files
+        )
         
         logger.info(f"Found {len(rule_matches)} rule matches")
         
@@ -130,8 +142,10 @@ class CleanPCPipeline:
         if preferences is None:
             preferences = PreferencesSchema()
         
+        # The planner blocks on the LLM call, so it runs off the loop too
         try:
-            plan = self.planner.create_plan(
+            plan = await asyncio.to_thread(
+                self.planner.create_plan,
                 task_id=task_id,
                 scan_result=combined_scan,
                 rule_matches=rule_matches,
@@ -140,23 +154,34 @@ class CleanPCPipeline:
         except Exception as e:
             logger.error(f"Failed to generate plan: {e}")
             # Fallback: create a simple plan from rule matches
-            plan = self._create_fallback_plan(task_id, rule_matches, classifications)
+            plan = await asyncio.to_thread(
+                self._create_fallback_plan, task_id, rule_matches, classifications
+            )
         
         # 7. Safety validation
         logger.info("Validating plan for safety...")
-        validation_result = self.safety.validate_plan(plan)
+        # Shared with the fallback validation so actions checked once aren't
+        # looked up on disk again
+        validation_cache: ValidationCache = {}
+        validation_result = await asyncio.to_thread(
+            self.safety.validate_plan, plan, validation_cache
+        )
         
         if not validation_result.is_safe:
             logger.warning(f"AI plan failed safety validation: {validation_result.errors}")
             logger.info("Falling back to rule-based plan...")
             
             # Try fallback plan instead of aborting
-            plan = self._create_fallback_plan(task_id, rule_matches, classifications)
+            plan = await asyncio.to_thread(
+                self._create_fallback_plan, task_id, rule_matches, classifications
+            )
             
             logger.info(f"Fallback plan created with {len(plan.actions)} actions, {len(plan.folders_to_create)} folders")
             
             # Validate fallback plan
-            validation_result = self.safety.validate_plan(plan)
+            validation_result = await asyncio.to_thread(
+                self.safety.validate_plan, plan, validation_cache
+            )
             
             logger.info(f"Fallback validation: is_safe={validation_result.is_safe}, errors={validation_result.errors}")
             
@@ -187,6 +212,66 @@ class CleanPCPipeline:
             }
         }
     
+    async def _scan_directories(
+        self,
+        target_dirs: List[str],
+        max_depth: int
+    ) -> Tuple[List[FileMetadata], List[str]]:
+        """
+        Scan the target directories concurrently, collecting files and errors.
+        
+        One Scanner walks the directories in parallel (their listings share
+        one worker pool) so their filesystem I/O overlaps; results are
+        merged in target_dirs order. A directory that fails to scan is
+        logged and reported in the errors instead of aborting the run.
+        
+        Args:
+            target_dirs: Directories to scan
+            max_depth: Maximum directory depth to scan
+            
+        Returns:
+            Tuple of (all scanned files, scan error messages)
+        """
+        all_files: List[FileMetadata] = []
+        scan_errors: List[str] = []
+        
+        scanner = Scanner(max_depth=max_depth)
+        results = await asyncio.to_thread(scanner.scan_many, target_dirs)
+        
+        for scan_result in results:
+            all_files.extend(scan_result.files)
+            scan_errors.extend(scan_result.errors)
+        
+        return all_files, scan_errors
+    
+    def _classify_and_match(
+        self,
+        files: List[FileMetadata]
+    ) -> Tuple[List[FileClassification], List[RuleMatchResult]]:
+        """
+        Classify files and apply organization rules to the classifications.
+        
+        Each file is classified and matched in the same pass, rather than
+        building the full classification list before a second walk.
+        
+        Args:
+            files: Scanned files
+            
+        Returns:
+            Tuple of (classifications, rule matches)
+        """
+        classifications: List[FileClassification] = []
+        rule_matches: List[RuleMatchResult] = []
+        match = self.rules.match
+        
+        for classification in self.classifier.iter_classify(files):
+            classifications.append(classification)
+            rule_match = match(classification)
+            if rule_match is not None:
+                rule_matches.append(rule_match)
+        
+        return classifications, rule_matches
+    
     async def execute_plan(
         self,
         task_id: str,
@@ -219,24 +304,21 @@ class CleanPCPipeline:
             "dry_run": dry_run
         }
     
-    def _get_default_target_dirs(self) -> List[str]:
+    async def _get_default_target_dirs(self) -> List[str]:
         """
         Get the default target directories for cleanup.
         
         Returns:
             List of directory paths
         """
-        home = Path.home()
-        
-        default_dirs = [
-            home / "Downloads",
-            home / "Desktop",
-            home / "Documents",
-            home / "Videos"
-        ]
+        default_dirs = [_HOME / name for name in _DEFAULT_DIR_NAMES]
         
-        # Only return directories that exist
-        return [str(d) for d in default_dirs if d.exists()]
+        # Only return directories that exist; the stats run concurrently so
+        # slow (e.g. network) home directories don't serialize them
+        exists = await asyncio.gather(
+            *(asyncio.to_thread(d.exists) for d in default_dirs)
+        )
+        return [str(d) for d, found in zip(default_dirs, exists) if found]
     
     def _generate_summary(
         self,
@@ -253,15 +335,26 @@ class CleanPCPipeline:
         Returns:
             Summary dictionary
         """
+        # One pass over the classifications; booleans count as 0/1
+        installers = archives = videos = screenshots = duplicates = 0
+        total_size = 0
+        for c in classifications:
+            installers += c.is_installer
+            archives += c.is_archive
+            videos += c.is_large_video
+            screenshots += c.is_screenshot
+            duplicates += c.is_duplicate
+            total_size += c.file.size_bytes
+        
         return {
             "total_files": len(classifications),
             "operations": len(plan.actions),
-            "installers_found": sum(1 for c in classifications if c.is_installer),
-            "archives_found": sum(1 for c in classifications if c.is_archive),
-            "large_videos": sum(1 for c in classifications if c.is_large_video),
-            "screenshots": sum(1 for c in classifications if c.is_screenshot),
-            "duplicates": sum(1 for c in classifications if c.is_duplicate),
-            "total_size_mb": sum(c.file.size_bytes for c in classifications) // (1024 * 1024)
+            "installers_found": installers,
+            "archives_found": archives,
+            "large_videos": videos,
+            "screenshots": screenshots,
+            "duplicates": duplicates,
+            "total_size_mb": total_size // (1024 * 1024)
         }
     
     def _create_fallback_plan(
@@ -283,51 +376,51 @@ class CleanPCPipeline:
         Returns:
             Simple plan based on classifications
         """
-        from sentinel_core.models.planner import PlanAction
-        from sentinel_core.models.enums import ActionType
-        from pathlib import Path
-        
         operations = []
-        folders_to_create = set()
-        home = Path.home()
+        # suggested_target -> resolved destination directory; there are only a
+        # few distinct targets, so each is expanded once
+        resolved_dirs: Dict[str, str] = {}
+        home = _HOME
+        # Tilde expansion is plain string concatenation with these
+        home_str = str(home)
+        home_prefix = home_str + os.sep
         
-        # Get scope path (parent of first file)
-        scope_paths = {str(Path(c.file.path).parent) for c in classifications if c.file}
-        scope_path = sorted(scope_paths)[0] if scope_paths else str(home / "Desktop")
+        # Scope path is the lowest parent directory, tracked in the same pass
+        min_parent: Optional[str] = None
         
         # Create operations from classifications
         for classification in classifications:
-            if not classification.suggested_action:
+            parent, name = os.path.split(classification.file.path)
+            if min_parent is None or parent < min_parent:
+                min_parent = parent
+            
+            # Determine action type (no action or unknown action: skip)
+            op_type = _ACTION_MAP.get(classification.suggested_action)
+            if op_type is None:
                 continue
-                
-            # Determine action type
-            if classification.suggested_action == "delete":
-                op_type = ActionType.DELETE
+            
+            if op_type is ActionType.DELETE:
                 dest_path = None
-            elif classification.suggested_action == "move":
-                op_type = ActionType.MOVE
-                
+            else:
                 # Expand tilde path and create absolute path
-                if classification.suggested_target and classification.suggested_target != "trash":
-                    target = classification.suggested_target
-                    # Expand ~
-                    if target.startswith("~/"):
-                        target = str(home / target[2:])
-                    elif target == "~":
-                        target = str(home)
+                target = classification.suggested_target
+                if target and target != "trash":
+                    dest_dir = resolved_dirs.get(target)
+                    if dest_dir is None:
+                        # Expand ~
+                        expanded = target
+                        if expanded.startswith("~/"):
+                            expanded = home_prefix + expanded[2:]
+                        elif expanded == "~":
+                            expanded = home_str
+                        # normpath drops the trailing slash and uses native separators
+                        dest_dir = resolved_dirs[target] = os.path.normpath(expanded)
                     
                     # Create destination path with filename
-                    dest_dir = Path(target)
-                    dest_path = str(dest_dir / Path(classification.file.path).name)
-                    
-                    # Track folders to create
-                    folders_to_create.add(str(dest_dir))
+                    dest_path = os.path.join(dest_dir, name)
                 else:
                     # No valid target, skip this operation
                     continue
-            else:
-                # Unknown action, skip
-                continue
             
             # Create the operation
             operation = PlanAction(
@@ -339,24 +432,17 @@ class CleanPCPipeline:
             )
             operations.append(operation)
         
+        scope_path = min_parent if min_parent is not None else str(home / "Desktop")
+        
         return PlanSchema(
             task_id=task_id,
             scope_path=scope_path,
-            folders_to_create=sorted(folders_to_create),
+            # Targets that differ only in spelling can resolve to the same folder
+            folders_to_create=sorted(set(resolved_dirs.values())),
             actions=operations,
             summary=f"Organized {len(operations)} files using rule-based classification"
         )
     
     def _get_classification_reason(self, classification: FileClassification) -> str:
         """Get reason string for a classification."""
-        if classification.is_installer:
-            return f"Old installer ({classification.age_days} days)"
-        if classification.is_archive:
-            return "Archive file"
-        if classification.is_large_video:
-            return f"Large video ({classification.video_size_mb}MB)"
-        if classification.is_screenshot:
-            return "Screenshot"
-        if classification.is_duplicate:
-            return "Duplicate file"
-        return "Organization"
+        return _FALLBACK_REASONS[classification.category].format(c=classification)
@@ -4,14 +4,35 @@ Organization Rules
 Deterministic rules for file organization based on classifications.
 """
 
-from typing import List, Callable
+import os
+from typing import List, Optional
 from dataclasses import dataclass
 
-from sentinel_core.cleanpc.classifiers import FileClassification
+from sentinel_core.cleanpc.classifiers import FileCategory, FileClassification
 from sentinel_core.rules.models import RuleMatchResult
 
 
-@dataclass
+# Match reasons by classification category, formatted with the
+# classification as `c` (duplicates with the original's file name)
+_REASON_TEMPLATES = {
+    FileCategory.INSTALLER: (
+        "Old installer ({c.age_days} days old) from Downloads/Desktop - safe to remove"
+    ),
+    FileCategory.ARCHIVE: "Archive file should be moved to Archives/{c.file.modified_at.year}/",
+    FileCategory.LARGE_VIDEO: (
+        "Large video file ({c.video_size_mb}MB) should be organized in Videos folder"
+    ),
+    FileCategory.SCREENSHOT: (
+        "Screenshot detected - organize in Pictures/Screenshots/{c.file.created_at.year}/"
+    ),
+    FileCategory.DUPLICATE: "Duplicate file (same as {name}) - keeping newest copy",
+}
+_OLD_ARCHIVE_REASON = (
+    "Archive file ({c.age_days} days old) in Downloads - likely no longer needed"
+)
+
+
+@dataclass(slots=True)
 class OrganizationRule:
     """
     A rule for organizing files.
@@ -19,13 +40,13 @@ class OrganizationRule:
     Attributes:
         name: Human-readable rule name
         priority: Rule priority (lower = higher priority)
-        condition: Function to check if rule applies
+        attr: Boolean FileClassification attribute that makes the rule apply
         category: Category for matched files
         confidence: Confidence score (0.0-1.0)
     """
     name: str
     priority: int
-    condition: Callable[[FileClassification], bool]
+    attr: str
     category: str
     confidence: float = 1.0
 
@@ -36,14 +57,15 @@ class OrganizationRules:
     """
     
     def __init__(self):
-        """Initialize with predefined rules."""
-        self.rules = self._define_rules()
+        """Initialize with predefined rules, sorted by priority once."""
+        self.rules = tuple(sorted(self._define_rules(), key=lambda r: r.priority))
     
     def _define_rules(self) -> List[OrganizationRule]:
         """
         Define the organization rules.
         
         Rules are ordered by priority. First matching rule wins.
+        Each rule names the classification flag it tests.
         
         Returns:
             List of organization rules
@@ -52,35 +74,35 @@ class OrganizationRules:
             OrganizationRule(
                 name="Screenshots to Pictures",
                 priority=1,
-                condition=lambda c: c.is_screenshot,
+                attr="is_screenshot",
                 category="screenshot",
                 confidence=0.95
             ),
             OrganizationRule(
                 name="Large Videos to Videos Folder",
                 priority=2,
-                condition=lambda c: c.is_large_video,
+                attr="is_large_video",
                 category="video",
                 confidence=0.90
             ),
             OrganizationRule(
                 name="Remove Old Installers",
                 priority=3,
-                condition=lambda c: c.is_installer,
+                attr="is_installer",
                 category="installer",
                 confidence=0.85
             ),
             OrganizationRule(
                 name="Archive Old Archives",
                 priority=4,
-                condition=lambda c: c.is_archive,
+                attr="is_archive",
                 category="archive",
                 confidence=0.90
             ),
             OrganizationRule(
                 name="Remove Duplicate Files",
                 priority=5,
-                condition=lambda c: c.is_duplicate,
+                attr="is_duplicate",
                 category="duplicate",
                 confidence=0.95
             ),
@@ -105,24 +127,39 @@ class OrganizationRules:
         matches = []
         
         for classification in classifications:
-            # Try each rule in priority order
-            for rule in sorted(self.rules, key=lambda r: r.priority):
-                if rule.condition(classification):
-                    # Generate reason based on classification
-                    reason = self._generate_reason(classification, rule)
-                    
-                    match = RuleMatchResult(
-                        file_path=classification.file.path,
-                        matched_rule=rule.name,
-                        suggested_category=rule.category,
-                        confidence=rule.confidence,
-                        reason=reason
-                    )
-                    matches.append(match)
-                    break  # First match wins
+            match = self.match(classification)
+            if match is not None:
+                matches.append(match)
         
         return matches
     
+    def match(self, classification: FileClassification) -> Optional[RuleMatchResult]:
+        """
+        Find the first rule matching a single classification.
+        
+        Args:
+            classification: File classification
+            
+        Returns:
+            Rule match result, or None if no rule applies
+        """
+        # Try each rule in priority order (pre-sorted in __init__)
+        for rule in self.rules:
+            if getattr(classification, rule.attr):
+                # Generate reason based on classification
+                reason = self._generate_reason(classification, rule)
+                
+                # First match wins
+                return RuleMatchResult(
+                    file_path=classification.file.path,
+                    matched_rule=rule.name,
+                    suggested_category=rule.category,
+                    confidence=rule.confidence,
+                    reason=reason
+                )
+        
+        return None
+    
     def _generate_reason(
         self, 
         classification: FileClassification, 
@@ -138,41 +175,14 @@ class OrganizationRules:
         Returns:
             Human-readable reason string
         """
-        if classification.is_installer:
-            return (
-                f"Old installer ({classification.age_days} days old) "
-                f"from Downloads/Desktop - safe to remove"
-            )
-        
-        if classification.is_archive:
-            if classification.suggested_action == "delete":
-                return (
-                    f"Archive file ({classification.age_days} days old) "
-                    f"in Downloads - likely no longer needed"
-                )
-            return (
-                f"Archive file should be moved to Archives/{classification.file.modified_at.year}/"
-            )
+        category = classification.category
+        template = _REASON_TEMPLATES.get(category)
+        if template is None:
+            return f"Matched rule: {rule.name}"
         
-        if classification.is_large_video:
-            return (
-                f"Large video file ({classification.video_size_mb}MB) "
-                f"should be organized in Videos folder"
-            )
+        if category is FileCategory.ARCHIVE and classification.suggested_action == "delete":
+            template = _OLD_ARCHIVE_REASON
+        elif category is FileCategory.DUPLICATE:
+            return template.format(name=os.path.basename(classification.duplicate_of))
         
-        if classification.is_screenshot:
-            return (
-                f"Screenshot detected - organize in Pictures/Screenshots/{classification.file.created_at.year}/"
-            )
-        
-        if classification.is_duplicate:
-            return (
-                f"Duplicate file (same as {Path(classification.duplicate_of).name}) "
-                f"- keeping newest copy"
-            )
-        
-        return f"Matched rule: {rule.name}"
-
-
-# Import Path for reason generation
-from pathlib import Path
+        return template.format(c=classification)
@@ -1,5 +1,6 @@
-"""CLI commands module."""
+"""CLI commands module.
 
-from . import scan, plan, apply, clean, undo, ask
+Command modules are imported on demand by the CLI's LazyCommandGroup.
+"""
 
 __all__ = ["scan", "plan", "apply", "clean", "undo", "ask"]
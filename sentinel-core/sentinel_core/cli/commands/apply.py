@@ -4,6 +4,8 @@ Apply Command
 Execute an organization plan with confirmations.
 """
 
+import json
+
 import typer
 from typing_extensions import Annotated
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
@@ -13,26 +15,38 @@ from sentinel_core.models import ActionType
 from ..console import console
 from ..ui.prompts import confirm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw):
+    """
+    Decode a stored plan.
+    
+    plan_json is a JSON column, so SQLAlchemy may already have decoded it;
+    JSON text left over is parsed with orjson when available (much faster
+    on plans with thousands of actions).
+    """
+    if not isinstance(raw, (str, bytes)):
+        return raw
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
-def _load_plan(task_id: str):
-    """Load plan from database."""
-    # TODO: Implement database retrieval
-    # For now, return None to show error
+def _fetch_plan_json(task_id: str):
+    """Fetch the raw plan JSON from the database (None if missing)."""
     from sentinel_core.memory.db import get_engine, get_session
     from sentinel_core.models.logging import TaskRecord
     from sqlmodel import select
     
     engine = get_engine()
     with get_session(engine) as session:
-        stmt = select(TaskRecord).where(TaskRecord.task_id == task_id)
-        task = session.exec(stmt).first()
-        
-        if task:
-            # Load the plan JSON
-            import json
-            return json.loads(task.plan_json) if hasattr(task, 'plan_json') else None
-    
-    return None
+        # Only the plan column is needed; don't hydrate the whole record
+        stmt = select(TaskRecord.plan_json).where(TaskRecord.task_id == task_id)
+        return session.exec(stmt).first()
 
 
 def apply_command(
@@ -50,13 +64,21 @@ def apply_command(
     # Load plan
     console.print(f"[info]Loading plan:[/] [highlight]{task_id}[/]")
     
+    # Only the DB read runs under the spinner; decoding is CPU-bound and
+    # would just compete with the status redraws
     with console.status("[info]Retrieving plan from database..."):
         try:
-            plan = _load_plan(task_id)
+            plan_json = _fetch_plan_json(task_id)
         except Exception as e:
             console.print(f"[error]Error loading plan:[/] {e}")
             raise typer.Exit(1)
     
+    try:
+        plan = _loads(plan_json) if plan_json is not None else None
+    except Exception as e:
+        console.print(f"[error]Error loading plan:[/] {e}")
+        raise typer.Exit(1)
+    
     if not plan:
         console.print(f"[error]Error:[/] Plan not found: {task_id}")
         console.print(f"\n[info]Tips:[/]")
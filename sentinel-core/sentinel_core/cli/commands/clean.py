@@ -4,14 +4,20 @@ Clean Command
 Clean common directories (Downloads, Desktop, Documents).
 """
 
+import asyncio
+import os
+import uuid
 from pathlib import Path
 from typing import List
 import typer
 from typing_extensions import Annotated
 
-from sentinel_core.scanner import scan_directory
 try:
-    from sentinel_core.planner import PlannerAgent
+    from sentinel_core.cleanpc.pipeline import CleanPCPipeline
+    from sentinel_core.cleanpc.hash_cache import HashCache
+    from sentinel_core.executor import Executor
+    from sentinel_core.planner import OllamaClient, PlannerAgent
+    from sentinel_core.safety.safety import SafetyValidator
     BACKEND_AVAILABLE = True
 except ImportError:
     BACKEND_AVAILABLE = False
@@ -50,7 +56,21 @@ def clean_command(
             paths_to_clean.append((loc, path))
         else:
             console.print(f"[warning]⚠ Skipping:[/] {loc} not found at {path}")
-    
+
+    # All locations go into one plan, so drop repeated locations and ones
+    # nested under another; otherwise their files would be planned twice
+    roots = {path.resolve() for _, path in paths_to_clean}
+    seen = set()
+    unique_paths = []
+    for loc, path in paths_to_clean:
+        resolved = path.resolve()
+        if resolved in seen or any(parent in roots for parent in resolved.parents):
+            console.print(f"[warning]⚠ Skipping:[/] {loc} is already covered by another location")
+            continue
+        seen.add(resolved)
+        unique_paths.append((loc, path))
+    paths_to_clean = unique_paths
+
     if not paths_to_clean:
         console.print("[error]Error:[/] No valid locations found")
         console.print("\n[info]Available locations:[/]")
@@ -67,60 +87,55 @@ def clean_command(
         console.print("[highlight]Dry-run mode:[/] No changes will be made")
         console.print("[muted]Use --execute to apply changes[/]\n")
     
-    # Process each location
-    task_ids = []
+    if not BACKEND_AVAILABLE:
+        console.print("[warning]⚠ Planner not available yet[/]")
+        raise typer.Exit(1)
+    
+    # One pipeline scans every location concurrently and plans them together
+    pipeline = CleanPCPipeline(
+        planner=PlannerAgent(OllamaClient()),
+        safety=SafetyValidator(),
+        executor=Executor(),
+        hash_cache=HashCache.try_open()
+    )
+    task_id = str(uuid.uuid4())
+    
+    with console.status(f"[info]Scanning and planning {len(paths_to_clean)} locations..."):
+        try:
+            result = asyncio.run(pipeline.scan_and_plan(
+                task_id=task_id,
+                target_dirs=[str(path) for _, path in paths_to_clean]
+            ))
+        except Exception as e:
+            console.print(f"[error]✗ Error:[/] {e}\n")
+            raise typer.Exit(1)
+    
+    # Report each location's files, grouped by root prefix (the scanner
+    # reports resolved paths)
+    classifications = result["classifications"]
     
     for loc_name, path in paths_to_clean:
         console.print(f"[highlight]📁 {loc_name}[/] ([path]{path}[/path])")
         
-        # Scan
-        with console.status(f"[info]Scanning {loc_name}..."):
-            try:
-                scan_result = scan_directory(str(path))
-            except Exception as e:
-                console.print(f"  [error]✗ Error:[/] {e}\n")
-                continue
-        
-        if scan_result.total_files == 0:
+        prefix = str(path.resolve()) + os.sep
+        file_count = sum(1 for c in classifications if c.file.path.startswith(prefix))
+        if file_count == 0:
             console.print(f"  [muted]Empty directory[/]\n")
-            continue
-        
-        console.print(f"  Files: [count]{scan_result.total_files}[/count]")
-        
-        #        # Plan
-        if not BACKEND_AVAILABLE:
-            console.print(f"  [warning]⚠ Planner not available yet[/]\n")
-            continue
-        
-        with console.status("Planning..."):
-            try:
-                planner = PlannerAgent()
-                plan = planner.generate(
-                    scan_result,
-                    user_prompt="Organize and clean this directory"
-                )
-            except Exception as e:
-                console.print(f"  [error]✗ Error:[/] {e}\n")
-                continue
-        
-        console.print(f"  Actions: [count]{len(plan.actions)}[/count]")
-        console.print(f"  Task ID: [highlight]{plan.task_id}[/]\n")
-        
-        task_ids.append(plan.task_id)
+        else:
+            console.print(f"  Files: [count]{file_count}[/count]\n")
+    
+    plan = result["plan"]
+    console.print(f"Actions: [count]{len(plan.actions)}[/count]")
+    console.print(f"Task ID: [highlight]{plan.task_id}[/]\n")
     
     # Summary
-    if task_ids:
-        console.print(f"[success]✓ Created {len(task_ids)} organization plans[/]\n")
-        
-        if dry_run:
-            console.print("[highlight]Next steps:[/]")
-            console.print("  Review and execute each plan:")
-            for task_id in task_ids:
-                console.print(f"    [path]sentinel apply {task_id}[/path]")
-        else:
-            console.print("[info]Plans executed successfully[/]")
-            console.print("\n[highlight]To undo:[/]")
-            for task_id in task_ids:
-                console.print(f"  [path]sentinel undo {task_id}[/path]")
+    console.print(f"[success]✓ Created organization plan[/]\n")
+    
+    if dry_run:
+        console.print("[highlight]Next steps:[/]")
+        console.print("  Review and execute the plan:")
+        console.print(f"    [path]sentinel apply {plan.task_id}[/path]")
     else:
-        console.print("[warning]No plans created[/]")
+        console.print("[info]Plan executed successfully[/]")
+        console.print("\n[highlight]To undo:[/]")
+        console.print(f"  [path]sentinel undo {plan.task_id}[/path]")
@@ -6,13 +6,15 @@ Typer command for running the Clean My PC pipeline.
 
 import typer
 import asyncio
+import os
+from itertools import islice
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from pathlib import Path
 
 from sentinel_core.cleanpc.pipeline import CleanPCPipeline
+from sentinel_core.cleanpc.hash_cache import HashCache
 from sentinel_core.planner.planner_agent import PlannerAgent
 from sentinel_core.planner.ollama_client import OllamaClient
 from sentinel_core.safety.safety import SafetyValidator
@@ -57,12 +59,35 @@ def scan(
     planner = PlannerAgent(ollama_client)
     safety = SafetyValidator()
     executor = Executor()
-    pipeline = CleanPCPipeline(planner=planner, safety=safety, executor=executor)
+    pipeline = CleanPCPipeline(
+        planner=planner,
+        safety=safety,
+        executor=executor,
+        hash_cache=HashCache.try_open()
+    )
     
     # Generate task ID
     import uuid
     task_id = str(uuid.uuid4())
     
+    # One event loop for both the scan and the execution phase, so loop
+    # setup and any client connections are shared between them
+    runner = asyncio.Runner()
+    try:
+        _scan_and_execute(runner, pipeline, task_id, dirs, dry_run, max_depth)
+    finally:
+        runner.close()
+
+
+def _scan_and_execute(
+    runner: asyncio.Runner,
+    pipeline: CleanPCPipeline,
+    task_id: str,
+    dirs: list[str],
+    dry_run: bool,
+    max_depth: int
+):
+    """Run the scan, show the proposed plan and execute it if confirmed."""
     # Run pipeline
     with Progress(
         SpinnerColumn(),
@@ -73,7 +98,7 @@ def scan(
         
         try:
             # Run async pipeline
-            result = asyncio.run(pipeline.scan_and_plan(
+            result = runner.run(pipeline.scan_and_plan(
                 task_id=task_id,
                 target_dirs=dirs,
                 max_depth=max_depth
@@ -118,10 +143,11 @@ def scan(
         ops_table.add_column("Target", style="green")
         ops_table.add_column("Reason", style="white", no_wrap=False)
         
-        # Show first 20 operations
-        for op in plan.actions[:20]:
+        # Show first 20 operations (islice avoids copying the list;
+        # os.path.basename avoids building a Path per row)
+        for op in islice(plan.actions, 20):
             action = op.type.value.upper()
-            file_name = Path(op.source_path).name
+            file_name = os.path.basename(op.source_path)
             target = op.destination_path or "Trash"
             reason = op.reason[:60] + "..." if len(op.reason) > 60 else op.reason
             
@@ -149,7 +175,7 @@ def scan(
         ) as progress:
             progress.add_task(description="Executing operations...", total=None)
             
-            exec_result = asyncio.run(pipeline.execute_plan(
+            exec_result = runner.run(pipeline.execute_plan(
                 task_id=task_id,
                 plan=plan,
                 dry_run=False
@@ -4,11 +4,13 @@ Plan Command
 Create an AI-powered organization plan.
 """
 
+from collections import Counter
 from pathlib import Path
 import typer
 from typing_extensions import Annotated
 
-from sentinel_core.scanner import scan_directory
+from sentinel_core.models.enums import ActionType
+from sentinel_core.scanner import PreviewCache, scan_directory
 # Import backend functions - gracefully handle if not available
 try:
     from sentinel_core.planner import PlannerAgent
@@ -45,7 +47,8 @@ def plan_command(
     
     with console.status("[info]Analyzing files..."):
         try:
-            scan_result = scan_directory(str(path.absolute()))
+            # Previews of unchanged files come from the cache on re-runs, if it opens
+            scan_result = scan_directory(str(path.absolute()), preview_cache=PreviewCache.try_open())
         except Exception as e:
             console.print(f"[error]Error during scan:[/] {e}")
             raise typer.Exit(1)
@@ -91,10 +94,11 @@ def plan_command(
     console.print(f"  Total actions: [count]{len(plan.actions)}[/count]")
     console.print(f"  Folders to create: [count]{len(plan.folders_to_create)}[/count]")
     
-    # Count action types
-    moves = sum(1 for a in plan.actions if a.type.value == "MOVE")
-    renames = sum(1 for a in plan.actions if a.type.value == "RENAME")
-    deletes = sum(1 for a in plan.actions if a.type.value == "DELETE")
+    # Count action types in one pass
+    counts = Counter(a.type for a in plan.actions)
+    moves = counts[ActionType.MOVE]
+    renames = counts[ActionType.RENAME]
+    deletes = counts[ActionType.DELETE]
     
     if moves:
         console.print(f"  • Moves: [count]{moves}[/count]")
@@ -4,22 +4,24 @@ Scan Command
 Scan a directory and display file statistics.
 """
 
+from collections import Counter, defaultdict
 from pathlib import Path
 import typer
 from rich.table import Table
 from typing_extensions import Annotated
 
-from sentinel_core.scanner import scan_directory
+from sentinel_core.scanner import PreviewCache, scan_directory_iter
 from ..console import console
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def _format_size(size_bytes: int) -> str:
     """Format bytes to human-readable size."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    # Each unit is 10 more bits; bit_length picks it without a division loop
+    unit = min(max(0, (size_bytes.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
 
 
 def scan_command(
@@ -44,9 +46,26 @@ def scan_command(
     # Perform scan
     console.print(f"[info]Scanning:[/] [path]{path.absolute()}[/path]")
     
-    with console.status("[info]Analyzing files..."):
+    # Aggregate batch by batch as the scan streams in, in a single pass
+    total_files = 0
+    total_size = 0
+    error_count = 0
+    file_types = Counter()
+    size_by_type = defaultdict(int)
+    
+    with console.status("[info]Analyzing files...") as status:
         try:
-            result = scan_directory(str(path.absolute()))
+            # Previews of unchanged files come from the cache on re-runs, if it opens
+            for batch in scan_directory_iter(str(path.absolute()), preview_cache=PreviewCache.try_open()):
+                # Counter tallies in C
+                exts = [file.extension or "(no extension)" for file in batch.files]
+                file_types.update(exts)
+                for ext, file in zip(exts, batch.files):
+                    size_by_type[ext] += file.size_bytes
+                    total_size += file.size_bytes
+                total_files += len(exts)
+                error_count += len(batch.errors)
+                status.update(f"[info]Analyzing files... ({total_files} found)")
         except Exception as e:
             console.print(f"[error]Error during scan:[/] {e}")
             raise typer.Exit(1)
@@ -54,29 +73,16 @@ def scan_command(
     # Display summary
     console.print(f"\n[success]✓ Scan complete[/]")
     
-    total_files = len(result.files)
-    total_size = sum(f.size_bytes for f in result.files)
-    scan_duration = (result.scanned_at - result.scanned_at).total_seconds() if hasattr(result, 'scan_duration_seconds') else 0.0
-    
     console.print(f"  Total files: [count]{total_files}[/count]")
     console.print(f"  Total size: [count]{_format_size(total_size)}[/count]")
     
-    if result.errors:
-        console.print(f"  [warning]Errors: {len(result.errors)}[/warning]")
+    if error_count:
+        console.print(f"  [warning]Errors: {error_count}[/warning]")
     
     if total_files == 0:
         console.print("\n[warning]No files found in this directory[/]")
         return
     
-    # Compute file type breakdown
-    file_types = {}
-    size_by_type = {}
-    
-    for file in result.files:
-        ext = file.extension if file.extension else "(no extension)"
-        file_types[ext] = file_types.get(ext, 0) + 1
-        size_by_type[ext] = size_by_type.get(ext, 0) + file.size_bytes
-    
     # Show file type breakdown
     console.print()
     table = Table(
@@ -90,11 +96,7 @@ def scan_command(
     table.add_column("% of Total", justify="right", style="muted")
     
     # Sort by file count descending
-    sorted_types = sorted(
-        file_types.items(),
-        key=lambda x: x[1],
-        reverse=True
-    )
+    sorted_types = file_types.most_common()
     
     # Show top 20 file types
     for ext, count in sorted_types[:20]:
@@ -20,5 +20,6 @@ sentinel_theme = Theme({
     "progress.description": "cyan",
 })
 
-# Shared console instance
-console = Console(theme=sentinel_theme)
+# Shared console instance. Output is styled through markup, so the
+# automatic repr highlighter (a regex pass over every printed string) is off.
+console = Console(theme=sentinel_theme, highlight=False)
@@ -4,18 +4,67 @@ Sentinel CLI - Main Application
 Entry point for the Sentinel command-line interface.
 """
 
+import asyncio
+from importlib import import_module
+from typing import Dict, List, Optional, Tuple
+
+import click
 import typer
+from typer.core import TyperGroup
+from typer.main import get_command_from_info
+from typer.models import CommandInfo
 from typing_extensions import Annotated
 
 from .console import console
 
+# libuv-based loop for the async pipeline commands; not on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_RICH_MARKUP_MODE = "rich"
+
+# Command name -> (module under .commands, function). Modules are imported
+# only when their command runs (or help lists it), so e.g. `sentinel scan`
+# doesn't load the planner, pipeline and database stack.
+_LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "scan": ("scan", "scan_command"),
+    "plan": ("plan", "plan_command"),
+    "apply": ("apply", "apply_command"),
+    "clean-pc": ("clean", "clean_command"),
+    "undo": ("undo", "undo_command"),
+    "ask": ("ask", "ask_command"),
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Typer group that imports a command's module on first use."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return [*super().list_commands(ctx), *(n for n in _LAZY_COMMANDS if n not in self.commands)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in _LAZY_COMMANDS:
+            module_name, func_name = _LAZY_COMMANDS[cmd_name]
+            module = import_module(f".commands.{module_name}", __package__)
+            command = get_command_from_info(
+                CommandInfo(name=cmd_name, callback=getattr(module, func_name)),
+                pretty_exceptions_short=app.pretty_exceptions_short,
+                rich_markup_mode=_RICH_MARKUP_MODE,
+            )
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
 # Create Typer app
 app = typer.Typer(
     name="sentinel",
     help="🛡️  Sentinel - AI-powered file organization assistant",
+    cls=LazyCommandGroup,
     no_args_is_help=True,
     add_completion=False,
-    rich_markup_mode="rich",
+    rich_markup_mode=_RICH_MARKUP_MODE,
 )
 
 
@@ -46,18 +95,10 @@ def main(
     Safely organize your Downloads, Desktop, and Documents with AI assistance.
     All operations are logged and reversible.
     """
-    pass
-
-
-# Register commands
-from .commands import scan, plan, apply, clean, undo, ask
+    # Every asyncio.run() in a command then gets a uvloop loop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-app.command(name="scan")(scan.scan_command)
-app.command(name="plan")(plan.plan_command)
-app.command(name="apply")(apply.apply_command)
-app.command(name="clean-pc")(clean.clean_command)
-app.command(name="undo")(undo.undo_command)
-app.command(name="ask")(ask.ask_command)
 
 
 if __name__ == "__main__":
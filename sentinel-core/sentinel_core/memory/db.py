@@ -10,6 +10,7 @@ import os
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from sqlalchemy.pool import StaticPool
 from sqlmodel import create_engine, Session, SQLModel, select
 
 from sentinel_core.models.preferences import (
@@ -24,7 +25,7 @@ DEFAULT_DB_PATH = os.path.expanduser("~/.sentinel/sentinel.db")
 DEFAULT_BACKUP_PATH = os.path.expanduser("~/.sentinel/preferences_backup.json")
 
 
-def get_engine(db_path: Optional[str] = None):
+def get_engine(db_path: Optional[str] = None, shared_connection: bool = False):
     """
     Get or create database engine.
     
@@ -32,6 +33,9 @@ def get_engine(db_path: Optional[str] = None):
     
     Args:
         db_path: Path to database file. If None, uses default (~/.sentinel/sentinel.db)
+        shared_connection: Keep one SQLite connection open and share it across
+            threads (StaticPool) instead of reconnecting per session. Meant for
+            long-lived processes such as the API server.
         
     Returns:
         SQLModel Engine instance
@@ -54,7 +58,15 @@ def get_engine(db_path: Optional[str] = None):
     
     # Create engine with connection string
     connection_string = f"sqlite:///{db_path}"
-    engine = create_engine(connection_string, echo=False)
+    if shared_connection:
+        engine = create_engine(
+            connection_string,
+            echo=False,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(connection_string, echo=False)
     
     return engine
 
@@ -1,6 +1,6 @@
 from sentinel_core.models.enums import FileType, ActionType, TaskStatus
 from sentinel_core.models.filesystem import FileMetadata, ScanResult
-from sentinel_core.models.planner import PlanSchema, PlanAction, AmbiguousFile
+from sentinel_core.models.planner import PlanSchema, PlanAction, AmbiguousFile, PLAN_ACTIONS_ADAPTER
 from sentinel_core.models.logging import ExecutionLogEntry, TaskRecord
 from sentinel_core.models.preferences import Preferences, PreferencesSchema, PreferencePattern, UserDecision
 from sentinel_core.models.executor import ExecutionResult, UndoOperation
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from sentinel_core.models.enums import FileType
 
 class FileMetadata(BaseModel):
@@ -16,6 +16,12 @@ class FileMetadata(BaseModel):
     preview_text: Optional[str] = Field(default=None, max_length=150, description="Short preview of text content")
     hash: Optional[str] = Field(default=None, description="SHA-256 hash if computed")
 
+    @field_validator("extension")
+    @classmethod
+    def normalize_extension(cls, v: str) -> str:
+        # Stored lowercased so classifiers and rules compare it directly
+        return v.lower()
+
     class Config:
         from_attributes = True
 
@@ -1,9 +1,11 @@
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from sentinel_core.models.enums import ActionType
 
 class PlanAction(BaseModel):
     """A proposed atomic action."""
+    model_config = ConfigDict(frozen=True)
+
     type: ActionType
     source_path: Optional[str] = None
     destination_path: Optional[str] = None
@@ -20,6 +22,9 @@ class PlanAction(BaseModel):
             raise ValueError(f"Destination path is required for {action_type}")
         return v
 
+# Compiled once; validates client-edited action lists without rebuilding a plan
+PLAN_ACTIONS_ADAPTER = TypeAdapter(List[PlanAction])
+
 class AmbiguousFile(BaseModel):
     """A file that the Planner is unsure about."""
     path: str
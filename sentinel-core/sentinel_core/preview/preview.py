@@ -52,75 +52,83 @@ def generate_terminal_preview(plan: PlanSchema) -> str:
     # Group actions by type
     actions_by_type = _group_actions_by_type(plan.actions)
     
+    # Each section is buffered and printed once: every console.print call
+    # pays for markup parsing and a render pass, so per-line prints dominate
+    # on plans with many actions.
+    
     # Folders to create
     if plan.folders_to_create:
-        console.print("[bold cyan]📁 Folders to Create[/bold cyan]")
+        lines = ["[bold cyan]📁 Folders to Create[/bold cyan]"]
         for folder in plan.folders_to_create:
             short_path = _shorten_path(folder, plan.scope_path)
-            console.print(f"  [cyan]+[/cyan] {short_path}")
+            lines.append(f"  [cyan]+[/cyan] {short_path}")
+        console.print("\n".join(lines))
         console.print()
     
     # Move operations
     if ActionType.MOVE in actions_by_type:
-        console.print("[bold blue]➜  Move Operations[/bold blue]")
+        lines = ["[bold blue]➜  Move Operations[/bold blue]"]
         for action in actions_by_type[ActionType.MOVE]:
             src = _shorten_path(action.source_path, plan.scope_path)
             dst = _shorten_path(action.destination_path, plan.scope_path)
             confidence_color = _get_confidence_color(action.confidence)
-            console.print(
+            lines.append(
                 f"  [blue]→[/blue] {src} [dim]→[/dim] {dst} "
                 f"[{confidence_color}]({action.confidence:.0%})[/{confidence_color}]"
             )
-            console.print(f"    [dim italic]{action.reason}[/dim italic]")
+            lines.append(f"    [dim italic]{action.reason}[/dim italic]")
+        console.print("\n".join(lines))
         console.print()
     
     # Rename operations
     if ActionType.RENAME in actions_by_type:
-        console.print("[bold magenta]✎  Rename Operations[/bold magenta]")
+        lines = ["[bold magenta]✎  Rename Operations[/bold magenta]"]
         for action in actions_by_type[ActionType.RENAME]:
             src = _shorten_path(action.source_path, plan.scope_path)
             dst = _shorten_path(action.destination_path, plan.scope_path)
             confidence_color = _get_confidence_color(action.confidence)
-            console.print(
+            lines.append(
                 f"  [magenta]⟲[/magenta] {src} [dim]→[/dim] {dst} "
                 f"[{confidence_color}]({action.confidence:.0%})[/{confidence_color}]"
             )
-            console.print(f"    [dim italic]{action.reason}[/dim italic]")
+            lines.append(f"    [dim italic]{action.reason}[/dim italic]")
+        console.print("\n".join(lines))
         console.print()
     
     # Delete operations (highlighted for safety)
     if ActionType.DELETE in actions_by_type:
-        console.print("[bold red]🗑️  Delete Operations[/bold red]")
+        lines = ["[bold red]🗑️  Delete Operations[/bold red]"]
         for action in actions_by_type[ActionType.DELETE]:
             src = _shorten_path(action.source_path, plan.scope_path)
             confidence_color = _get_confidence_color(action.confidence)
-            console.print(
+            lines.append(
                 f"  [red bold]✗[/red bold] {src} "
                 f"[{confidence_color}]({action.confidence:.0%})[/{confidence_color}]"
             )
-            console.print(f"    [dim italic]{action.reason}[/dim italic]")
+            lines.append(f"    [dim italic]{action.reason}[/dim italic]")
+        console.print("\n".join(lines))
         console.print()
     
     # Skip operations
     if ActionType.SKIP in actions_by_type:
-        console.print("[bold dim]⊘  Skipped Files[/bold dim]")
+        lines = ["[bold dim]⊘  Skipped Files[/bold dim]"]
         for action in actions_by_type[ActionType.SKIP]:
             src = _shorten_path(action.source_path, plan.scope_path)
-            console.print(
-                f"  [dim]○[/dim] {src}"
-            )
-            console.print(f"    [dim italic]{action.reason}[/dim italic]")
+            lines.append(f"  [dim]○[/dim] {src}")
+            lines.append(f"    [dim italic]{action.reason}[/dim italic]")
+        console.print("\n".join(lines))
         console.print()
     
     # Ambiguous files (needs manual review)
     if plan.ambiguous_files:
-        console.print("[bold yellow]⚠️  Ambiguous Files (Manual Review Required)[/bold yellow]")
+        lines = ["[bold yellow]⚠️  Ambiguous Files (Manual Review Required)[/bold yellow]"]
         for ambiguous in plan.ambiguous_files:
             short_path = _shorten_path(ambiguous.path, plan.scope_path)
-            console.print(f"  [yellow]?[/yellow] {short_path}")
-            console.print(f"    [dim italic]{ambiguous.reason}[/dim italic]")
+            lines.append(f"  [yellow]?[/yellow] {short_path}")
+            lines.append(f"    [dim italic]{ambiguous.reason}[/dim italic]")
             if ambiguous.suggested_action:
-                console.print(f"    [dim]Suggested: {ambiguous.suggested_action.value}[/dim]")
+                lines.append(f"    [dim]Suggested: {ambiguous.suggested_action.value}[/dim]")
+        console.print("\n".join(lines))
         console.print()
     
     # Statistics footer
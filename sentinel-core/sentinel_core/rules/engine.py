@@ -81,7 +81,7 @@ class RulesEngine:
     def _check_condition(self, file: FileMetadata, condition: RuleCondition) -> bool:
         """Checks if a file satisfies a specific condition block."""
         
-        if condition.extension and file.extension.lower() != condition.extension.lower():
+        if condition.extension and file.extension != condition.extension.lower():
             return False
             
         if condition.name_contains:
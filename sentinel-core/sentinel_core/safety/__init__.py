@@ -1 +1 @@
-from sentinel_core.safety.safety import SafetyValidator, SafetyValidationResult
+from sentinel_core.safety.safety import IssueCode, SafetyValidator, SafetyValidationResult
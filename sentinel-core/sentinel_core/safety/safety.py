@@ -1,69 +1,262 @@
-from pathlib import Path
-from typing import List, Optional
+import os
+import stat
+import sys
+from enum import IntEnum
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 from sentinel_core.models.planner import PlanSchema, PlanAction
 from sentinel_core.models.enums import ActionType
 from sentinel_core.safety.constants import PROTECTED_PATHS
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class IssueCode(IntEnum):
+    """Kinds of safety issue. Messages are only rendered when requested."""
+    SCOPE_MISSING = 1
+    FOLDER_OUT_OF_SCOPE = 2
+    PROTECTED_FOLDER = 3
+    SYMLINKED_SOURCE = 4
+    SYMLINKED_DESTINATION = 5
+    SOURCE_OUT_OF_SCOPE = 6
+    PROTECTED_SOURCE = 7
+    SOURCE_MISSING = 8
+    DESTINATION_OUT_OF_SCOPE = 9
+    PROTECTED_DESTINATION = 10
+
+
+_ISSUE_MESSAGES = {
+    IssueCode.SCOPE_MISSING: "Scope root does not exist: {}",
+    IssueCode.FOLDER_OUT_OF_SCOPE: "Folder creation outside scope: {}",
+    IssueCode.PROTECTED_FOLDER: "Cannot create folder in protected path: {}",
+    IssueCode.SYMLINKED_SOURCE: "Cannot touch symlinked source: {}",
+    IssueCode.SYMLINKED_DESTINATION: "Cannot write to symlinked destination: {}",
+    IssueCode.SOURCE_OUT_OF_SCOPE: "Action source outside scope: {}",
+    IssueCode.PROTECTED_SOURCE: "Cannot touch protected source: {}",
+    IssueCode.SOURCE_MISSING: "Source file does not exist: {}",
+    IssueCode.DESTINATION_OUT_OF_SCOPE: "Action destination outside scope: {}",
+    IssueCode.PROTECTED_DESTINATION: "Cannot write to protected destination: {}",
+}
+
+# Issues that make a plan unsafe; the rest are reported as warnings
+_ERROR_CODES = frozenset({
+    IssueCode.SCOPE_MISSING,
+    IssueCode.PROTECTED_FOLDER,
+    IssueCode.SYMLINKED_SOURCE,
+    IssueCode.SYMLINKED_DESTINATION,
+    IssueCode.PROTECTED_SOURCE,
+    IssueCode.SOURCE_MISSING,
+    IssueCode.PROTECTED_DESTINATION,
+})
+
+# (code, offending path)
+Issue = Tuple[IssueCode, str]
+
+# Filesystem lookups for one action, independent of the plan's scope:
+# (source symlinked, destination symlinked, resolved source, resolved
+# destination, source exists)
+ActionFacts = Tuple[bool, bool, Optional[str], Optional[str], bool]
+
+# (source_path, destination_path) -> ActionFacts, shared between validations
+ValidationCache = Dict[Tuple[Optional[str], Optional[str]], ActionFacts]
+
+
+def format_issue(issue: Issue) -> str:
+    """Renders an issue tuple as a human-readable message."""
+    code, path = issue
+    return _ISSUE_MESSAGES[code].format(path)
+
+
 class SafetyValidationResult:
-    def __init__(self, is_safe: bool, issues: List[str]):
+    def __init__(self, is_safe: bool, issues: List[Issue]):
         self.issues = issues
-        self.errors = [issue for issue in issues if "Cannot" in issue or "does not exist" in issue]
-        self.warnings = [issue for issue in issues if issue not in self.errors]
         # is_safe should be based on errors, not all issues (warnings OK)
-        self.is_safe = len(self.errors) == 0
+        self.is_safe = not any(code in _ERROR_CODES for code, _ in issues)
+
+    @cached_property
+    def errors(self) -> List[str]:
+        return [format_issue(issue) for issue in self.issues if issue[0] in _ERROR_CODES]
+
+    @cached_property
+    def warnings(self) -> List[str]:
+        return [format_issue(issue) for issue in self.issues if issue[0] not in _ERROR_CODES]
+
+    def __str__(self):
+        return "\n".join(format_issue(issue) for issue in self.issues)
 
     def __repr__(self):
         return f"SafetyValidationResult(is_safe={self.is_safe}, errors={self.errors}, warnings={self.warnings})"
 
+# macOS and Windows filesystems are case-insensitive by default
+_CASE_INSENSITIVE = sys.platform in ("darwin", "win32")
+
+
+# str.startswith(tuple) is faster for the handful of built-in roots; the
+# automaton only pays off once the protected set grows large.
+_AUTOMATON_MIN_PREFIXES = 64
+
+
+@lru_cache(maxsize=4096)
+def _cached_realpath(path: str) -> str:
+    """Resolves symlinks once per distinct path string (cleared per plan)."""
+    return os.path.realpath(path)
+
+
 class SafetyValidator:
-    def validate_plan(self, plan: PlanSchema) -> SafetyValidationResult:
+    def __init__(self):
+        # Precompute protected roots once so each check is a single C-level
+        # str.startswith(tuple) scan instead of a Python loop over Path objects.
+        roots = [self._normalize(str(p)) for p in PROTECTED_PATHS]
+        self._protected_roots = frozenset(roots)
+        self._protected_prefixes = tuple(root.rstrip(os.sep) + os.sep for root in roots)
+        self._prefix_automaton = self._build_prefix_automaton(self._protected_prefixes)
+
+    @staticmethod
+    def _build_prefix_automaton(prefixes: Tuple[str, ...]):
+        """Compiles prefixes into an Aho-Corasick automaton, if worthwhile."""
+        if ahocorasick is None or len(prefixes) < _AUTOMATON_MIN_PREFIXES:
+            return None
+        automaton = ahocorasick.Automaton()
+        for prefix in prefixes:
+            automaton.add_word(prefix, len(prefix))
+        automaton.make_automaton()
+        return automaton
+
+    def validate_plan(
+        self,
+        plan: PlanSchema,
+        cache: Optional[ValidationCache] = None
+    ) -> SafetyValidationResult:
         """
         Validates the compliance of a plan with safety rules.
+
+        Args:
+            plan: Plan to validate
+            cache: Optional dict shared by validations of plans built from the
+                same scan (e.g. an AI plan and its fallback). Filesystem
+                lookups for each (source, destination) pair are stored here
+                and reused; scope and protected-path checks always run.
         """
-        issues = []
-        scope_root = Path(plan.scope_path).resolve()
+        if cache is None:
+            cache = {}
+        if not cache:
+            # Filesystem state may have changed since the last plan
+            _cached_realpath.cache_clear()
+
+        issues: List[Issue] = []
+        scope_root = _cached_realpath(plan.scope_path)
         
         # 1. Scope Root Validation
-        if not scope_root.exists():
-            issues.append(f"Scope root does not exist: {scope_root}")
+        if not os.path.exists(scope_root):
+            issues.append((IssueCode.SCOPE_MISSING, scope_root))
         
         # 2. Check Folders Creation
+        # Folders whose canonical form equals their absolute form contain no
+        # symlinked components, so destinations directly inside them can skip
+        # realpath (see _resolve_destination).
+        trusted_parents: Set[str] = set()
         for folder in plan.folders_to_create:
-            f_path = Path(folder).resolve()
+            f_path = _cached_realpath(folder)
+            if f_path == os.path.abspath(folder):
+                trusted_parents.add(f_path)
             # Must be within scope
             if not self._is_subpath(f_path, scope_root):
-                 issues.append(f"Folder creation outside scope: {f_path}")
+                 issues.append((IssueCode.FOLDER_OUT_OF_SCOPE, f_path))
             # Must not be system path
             if self._is_protected(f_path):
-                issues.append(f"Cannot create folder in protected path: {f_path}")
+                issues.append((IssueCode.PROTECTED_FOLDER, f_path))
 
         # 3. Check Actions
+        # Only actions not seen by an earlier validation touch the filesystem.
+        new_actions: List[PlanAction] = []
+        cached_symlink = False
         for action in plan.actions:
-            action_issues = self._validate_action(action, scope_root)
-            issues.extend(action_issues)
+            facts = cache.get((action.source_path, action.destination_path))
+            if facts is None:
+                new_actions.append(action)
+            elif facts[0] or facts[1]:
+                cached_symlink = True
+
+        # Single lstat prescan of the unresolved paths; one symlink anywhere
+        # disables the trusted-parent fast path for the whole plan.
+        symlinks = {
+            path
+            for action in new_actions
+            for path in (action.source_path, action.destination_path)
+            if path and self._is_symlink(path)
+        }
+        if symlinks or cached_symlink:
+            trusted_parents.clear()
+
+        for action in new_actions:
+            cache[(action.source_path, action.destination_path)] = self._action_facts(
+                action, symlinks, trusted_parents
+            )
+
+        for action in plan.actions:
+            facts = cache[(action.source_path, action.destination_path)]
+            issues.extend(self._validate_action(action, facts, scope_root))
 
         return SafetyValidationResult(is_safe=len(issues) == 0, issues=issues)
 
-    def _validate_action(self, action: PlanAction, scope_root: Path) -> List[str]:
-        issues = []
-        source_path = Path(action.source_path).resolve() if action.source_path else None
-        dest_path = Path(action.destination_path).resolve() if action.destination_path else None
+    def _action_facts(
+        self,
+        action: PlanAction,
+        symlinks: Set[str],
+        trusted_parents: Set[str],
+    ) -> ActionFacts:
+        """Performs the filesystem lookups an action's checks depend on."""
+        source_symlinked = action.source_path in symlinks
+        dest_symlinked = action.destination_path in symlinks
+        # Symlinked actions are rejected before canonicalization
+        if source_symlinked or dest_symlinked:
+            return source_symlinked, dest_symlinked, None, None, True
+
+        source_path = _cached_realpath(action.source_path) if action.source_path else None
+        dest_path = (
+            self._resolve_destination(action.destination_path, trusted_parents)
+            if action.destination_path
+            else None
+        )
+        source_exists = os.path.exists(source_path) if source_path else True
+        return False, False, source_path, dest_path, source_exists
+
+    def _validate_action(
+        self,
+        action: PlanAction,
+        facts: ActionFacts,
+        scope_root: str,
+    ) -> List[Issue]:
+        issues: List[Issue] = []
+        source_symlinked, dest_symlinked, source_path, dest_path, source_exists = facts
+
+        # Reject symlinks before canonicalization - resolving them first would
+        # erase the evidence and let a link redirect the operation elsewhere.
+        if source_symlinked:
+            issues.append((IssueCode.SYMLINKED_SOURCE, action.source_path))
+        if dest_symlinked:
+            issues.append((IssueCode.SYMLINKED_DESTINATION, action.destination_path))
+        if issues:
+            return issues
 
         # Check Source
         if source_path:
             if not self._is_subpath(source_path, scope_root):
-                issues.append(f"Action source outside scope: {source_path}")
+                issues.append((IssueCode.SOURCE_OUT_OF_SCOPE, source_path))
             if self._is_protected(source_path):
-                issues.append(f"Cannot touch protected source: {source_path}")
-            if not source_path.exists():
-                issues.append(f"Source file does not exist: {source_path}")
+                issues.append((IssueCode.PROTECTED_SOURCE, source_path))
+            if not source_exists:
+                issues.append((IssueCode.SOURCE_MISSING, source_path))
 
         # Check Destination
         if dest_path:
             if not self._is_subpath(dest_path, scope_root):
-                 issues.append(f"Action destination outside scope: {dest_path}")
+                 issues.append((IssueCode.DESTINATION_OUT_OF_SCOPE, dest_path))
             if self._is_protected(dest_path):
-                 issues.append(f"Cannot write to protected destination: {dest_path}")
+                 issues.append((IssueCode.PROTECTED_DESTINATION, dest_path))
 
         # Action Constraints
         if action.type == ActionType.DELETE:
@@ -72,22 +265,41 @@ class SafetyValidator:
 
         return issues
 
-    def _is_subpath(self, path: Path, parent: Path) -> bool:
-        """Checks if path is inside parent directory."""
+    def _resolve_destination(self, path: str, trusted_parents: Set[str]) -> str:
+        """Canonicalizes a destination, skipping realpath under trusted parents."""
+        abs_path = os.path.abspath(path)
+        if os.path.dirname(abs_path) in trusted_parents:
+            return abs_path
+        return _cached_realpath(path)
+
+    def _is_symlink(self, path: str) -> bool:
+        """Checks the unresolved path itself (not its target) for a symlink."""
         try:
-            path.relative_to(parent)
-            return True
-        except ValueError:
+            return stat.S_ISLNK(os.lstat(path).st_mode)
+        except OSError:
+            # Missing paths are reported by the existence checks
             return False
 
-    def _is_protected(self, path: Path) -> bool:
+    def _is_subpath(self, path: str, parent: str) -> bool:
+        """Checks if path is inside parent directory."""
+        if path == parent:
+            return True
+        prefix = parent if parent.endswith(os.sep) else parent + os.sep
+        return path.startswith(prefix)
+
+    def _is_protected(self, path: str) -> bool:
         """Checks if a path is a system protected path."""
-        for protected in PROTECTED_PATHS:
-            # Check if path is equal to or inside a protected path
-            # E.g. /System/foo is protected because /System is protected
-            try:
-                if path == protected or protected in path.parents:
-                    return True
-            except Exception:
-                continue
-        return False
+        # Equal to or inside a protected path
+        # E.g. /System/foo is protected because /System is protected
+        candidate = self._normalize(path)
+        if candidate in self._protected_roots:
+            return True
+        if self._prefix_automaton is None:
+            return candidate.startswith(self._protected_prefixes)
+        # A match is a prefix when it ends exactly len(prefix) - 1 into the path
+        return any(end + 1 == length for end, length in self._prefix_automaton.iter(candidate))
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        """Normalizes case for comparison on case-insensitive platforms."""
+        return path.lower() if _CASE_INSENSITIVE else path
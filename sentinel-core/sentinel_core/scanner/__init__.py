@@ -1,16 +1,20 @@
 """Scanner module for Sentinel."""
 
 from .scanner import Scanner
+from .preview_cache import PreviewCache
+from . import config
 
-__all__ = ["Scanner", "scan_directory"]
+__all__ = ["Scanner", "PreviewCache", "scan_directory", "scan_directory_iter"]
 
 
-def scan_directory(path: str):
+def scan_directory(path: str, on_progress=None, preview_cache=None):
     """
     Convenience function to scan a directory.
     
     Args:
         path: Path to directory to scan
+        on_progress: Optional callback receiving the running file count
+        preview_cache: Optional PreviewCache reused across scans
         
     Returns:
         ScanResult containing file metadata
@@ -20,5 +24,30 @@ def scan_directory(path: str):
         >>> result = scan_directory("/path/to/folder")
         >>> print(f"Found {result.total_files} files")
     """
-    scanner = Scanner(path)
-    return scanner.scan()
+    scanner = Scanner(path, preview_cache=preview_cache)
+    return scanner.scan(on_progress=on_progress)
+
+
+def scan_directory_iter(
+    path: str,
+    batch_size: int = config.SCAN_BATCH_SIZE,
+    preview_cache=None
+):
+    """
+    Convenience function to scan a directory incrementally.
+    
+    Args:
+        path: Path to directory to scan
+        batch_size: Maximum number of files per yielded result
+        preview_cache: Optional PreviewCache reused across scans
+        
+    Yields:
+        Partial ScanResults, each with a batch of files and the errors
+        hit while collecting it
+        
+    Example:
+        >>> from sentinel_core.scanner import scan_directory_iter
+        >>> total = sum(len(batch.files) for batch in scan_directory_iter("/path"))
+    """
+    scanner = Scanner(path, preview_cache=preview_cache)
+    return scanner.scan_iter(batch_size=batch_size)
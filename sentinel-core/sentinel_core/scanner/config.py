@@ -1,7 +1,12 @@
 # Scanner Configuration
+import os
+
 MAX_SCAN_DEPTH = 3  # Default recursion depth
 MAX_PREVIEW_SIZE_CHARS = 500  # Max characters to read for preview
 TEXT_EXTENSIONS = {'.txt', '.md', '.py', '.js', '.json', '.csv', '.html', '.css', '.xml', '.yml', '.yaml'}
 PDF_EXTENSIONS = {'.pdf'}
 IGNORED_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'env', '.DS_Store', 'Thumbs.db'}
 MAX_FILE_SIZE_PREVIEW = 10 * 1024 * 1024 # 10MB limit for attempting preview
+SCAN_PROGRESS_INTERVAL = 500  # Files between progress callbacks
+SCAN_BATCH_SIZE = 512  # Files per partial result from Scanner.scan_iter
+SCAN_WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Threads listing directories during a walk
@@ -0,0 +1,67 @@
+"""
+Persistent Preview Cache
+
+Remembers file previews across scans so unchanged text and PDF files
+aren't re-read on every `sentinel scan`/`plan` run.
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sentinel_core.scanner.sqlite_cache import DEFAULT_MAX_ENTRIES, FileKey, SQLiteKeyedCache
+
+# Default cache location, next to the preferences database
+DEFAULT_PREVIEW_CACHE_PATH = os.path.expanduser("~/.sentinel/scan_cache.db")
+
+
+class PreviewCache(SQLiteKeyedCache):
+    """
+    SQLite-backed cache of file previews.
+
+    Entries are keyed by path and only reused while the file's size and
+    modification time (in nanoseconds) still match. A cached preview may
+    be None, for files that had no readable text. The least recently used
+    entries are evicted once the cache holds more than max_entries.
+
+    A connection is opened per call, so one cache can be used from worker
+    threads (Scanner.scan_many walks roots in parallel).
+
+    Example:
+        >>> cache = PreviewCache()
+        >>> scanner = Scanner("/path/to/folder", preview_cache=cache)
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_PREVIEW_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            max_entries: Row count above which old entries are evicted
+        """
+        super().__init__(db_path, "file_previews", {"preview": "TEXT"}, max_entries)
+
+    def get_many(self, keys: List[FileKey]) -> Dict[str, Optional[str]]:
+        """
+        Look up cached previews for files that haven't changed.
+
+        Args:
+            keys: (path, st_mtime_ns, st_size) of the files to look up
+
+        Returns:
+            Dictionary mapping file path to preview, for cache hits only
+        """
+        return {path: preview for path, (preview,) in self._get_many(keys).items()}
+
+    def put_many(self, entries: Iterable[Tuple[FileKey, Optional[str]]]) -> None:
+        """
+        Store previews for files, replacing older entries.
+
+        Args:
+            entries: ((path, st_mtime_ns, st_size), preview) pairs
+        """
+        self._put_many((key, (preview,)) for key, preview in entries)
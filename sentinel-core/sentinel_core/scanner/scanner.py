@@ -1,96 +1,328 @@
 import os
 import hashlib
+import logging
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from pypdf import PdfReader
 from sentinel_core.models.enums import FileType
 from sentinel_core.models.filesystem import FileMetadata, ScanResult
 from sentinel_core.scanner import config
+from sentinel_core.scanner.preview_cache import FileKey, PreviewCache
+
+logger = logging.getLogger(__name__)
+
+
+def _suffix(name: str) -> str:
+    """Same result as Path(name).suffix, without building a Path."""
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ''
+
 
 class Scanner:
-    def __init__(self, root_path: str, max_depth: int = config.MAX_SCAN_DEPTH):
-        self.root_path = Path(root_path).resolve()
+    def __init__(
+        self,
+        root_path: Optional[str] = None,
+        max_depth: int = config.MAX_SCAN_DEPTH,
+        preview_cache: Optional[PreviewCache] = None
+    ):
+        # root_path may be omitted when the scanner is only used for scan_many()
+        self.root_path = Path(root_path).resolve() if root_path is not None else None
         self.max_depth = max_depth
+        # Optional persistent cache so unchanged files aren't re-read for previews
+        self.preview_cache = preview_cache
         self.ignored_dirs = config.IGNORED_DIRS
         self.text_extensions = config.TEXT_EXTENSIONS
         self.pdf_extensions = config.PDF_EXTENSIONS
 
-    def scan(self) -> ScanResult:
+    def scan(self, on_progress: Optional[Callable[[int], None]] = None) -> ScanResult:
         """
         Recursively scan the directory and return a ScanResult.
+
+        Args:
+            on_progress: Optional callback, called with the number of files
+                scanned so far every config.SCAN_PROGRESS_INTERVAL files.
+                Runs on the scanning thread, so it must be cheap and thread-safe.
+        """
+        if self.root_path is None:
+            raise ValueError("Scanner has no root_path; use scan_many() instead")
+        return self._scan_root(self.root_path, on_progress)
+
+    def scan_many(self, root_paths: Sequence[str]) -> List[ScanResult]:
+        """
+        Scan several directories with this scanner's settings.
+
+        Each root is walked on its own thread, so a large tree doesn't hold
+        up the smaller ones, while directory listings for all roots share
+        one pool of config.SCAN_WALK_WORKERS threads. Results keep per-root
+        error attribution.
+
+        Args:
+            root_paths: Directories to scan
+
+        Returns:
+            One ScanResult per root, in root_paths order
+        """
+        if not root_paths:
+            return []
+
+        roots = [Path(p).resolve() for p in root_paths]
+        with ThreadPoolExecutor(max_workers=config.SCAN_WALK_WORKERS) as walk_pool:
+            with ThreadPoolExecutor(max_workers=len(roots)) as pool:
+                futures = [
+                    pool.submit(self._scan_root, root, walk_pool=walk_pool)
+                    for root in roots
+                ]
+
+        results: List[ScanResult] = []
+        for root, future in zip(roots, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Failed to scan {root}: {e}")
+                results.append(ScanResult(
+                    root_path=str(root),
+                    files=[],
+                    errors=[f"Failed to scan {root}: {str(e)}"]
+                ))
+        return results
+
+    def scan_iter(self, batch_size: int = config.SCAN_BATCH_SIZE) -> Iterator[ScanResult]:
+        """
+        Recursively scan the directory, yielding results as they are found.
+
+        Each yielded ScanResult holds up to batch_size files plus the errors
+        hit since the previous batch, so callers can aggregate without the
+        whole file list in memory.
+
+        Args:
+            batch_size: Maximum number of files per yielded result
         """
-        if not self.root_path.exists():
-            return ScanResult(
-                root_path=str(self.root_path),
-                files=[],
-                errors=[f"Directory not found: {self.root_path}"]
-            )
+        if self.root_path is None:
+            raise ValueError("Scanner has no root_path; use scan_many() instead")
+
+        root = str(self.root_path)
+        batch: List[FileMetadata] = []
+        errors: List[str] = []
+
+        for metadata in self._iter_root(self.root_path, errors):
+            batch.append(metadata)
+            if len(batch) >= batch_size:
+                yield ScanResult(root_path=root, files=batch, errors=errors.copy())
+                batch = []
+                errors.clear()
+
+        if batch or errors:
+            yield ScanResult(root_path=root, files=batch, errors=errors.copy())
 
+    def _scan_root(
+        self,
+        root_path: Path,
+        on_progress: Optional[Callable[[int], None]] = None,
+        walk_pool: Optional[ThreadPoolExecutor] = None
+    ) -> ScanResult:
+        """Walk one resolved root and collect its file metadata."""
         files_metadata: List[FileMetadata] = []
         errors: List[str] = []
         ignored_count = 0
 
-        try:
-            for path in self._safe_walk(self.root_path, current_depth=0):
-                try:
-                    metadata = self._extract_metadata(path)
-                    files_metadata.append(metadata)
-                except Exception as e:
-                    errors.append(f"Failed to process {path}: {str(e)}")
-                    
-        except Exception as e:
-            errors.append(f"Fatal scan error: {str(e)}")
+        for metadata in self._iter_root(root_path, errors, walk_pool):
+            files_metadata.append(metadata)
+            if on_progress and len(files_metadata) % config.SCAN_PROGRESS_INTERVAL == 0:
+                on_progress(len(files_metadata))
 
         return ScanResult(
-            root_path=str(self.root_path),
+            root_path=str(root_path),
             files=files_metadata,
             ignored_count=ignored_count, # Note: _safe_walk doesn't count ignored yet for simplicity
             errors=errors
         )
 
-    def _safe_walk(self, directory: Path, current_depth: int):
+    def _iter_root(
+        self,
+        root_path: Path,
+        errors: List[str],
+        walk_pool: Optional[ThreadPoolExecutor] = None
+    ) -> Iterator[FileMetadata]:
         """
-        Generator that yields file paths recursively up to max_depth.
+        Generator that yields metadata for each file under a resolved root.
+
+        Failures are appended to errors instead of stopping the walk.
+        Directory listings run on walk_pool if given (shared across roots
+        by scan_many), otherwise on a pool owned by this walk.
         """
-        if current_depth > self.max_depth:
+        if not root_path.exists():
+            errors.append(f"Directory not found: {root_path}")
             return
 
+        # Directory listings are fetched on worker threads ahead of the walk;
+        # only the workers hold directory handles, so open FDs stay bounded
+        pool = walk_pool or ThreadPoolExecutor(max_workers=config.SCAN_WALK_WORKERS)
+        try:
+            listing = pool.submit(self._list_dir, str(root_path))
+            walk = self._safe_walk(pool, listing, current_depth=0)
+            # Files are processed in chunks so preview cache lookups and
+            # writes are one query per chunk
+            while chunk := list(islice(walk, config.SCAN_BATCH_SIZE)):
+                cached = self._load_cached_previews(chunk)
+                fresh: List[Tuple[FileKey, Optional[str]]] = []
+                for entry in chunk:
+                    try:
+                        metadata = self._extract_metadata(entry, cached, fresh)
+                    except Exception as e:
+                        errors.append(f"Failed to process {entry.path}: {str(e)}")
+                        continue
+                    yield metadata
+                self._store_cached_previews(fresh)
+                    
+        except Exception as e:
+            errors.append(f"Fatal scan error: {str(e)}")
+        finally:
+            # Also runs if the consumer stops early; drop unstarted listings.
+            # A shared pool is shut down by its owner instead.
+            if walk_pool is None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def _list_dir(self, directory: str) -> Optional[List[os.DirEntry]]:
+        """
+        Lists a directory sorted by name; runs on a walk worker thread.
+
+        Uses os.scandir so file/directory checks come from the directory
+        listing instead of a stat() call per entry.
+        """
         try:
             # Sort for deterministic order
-            entries = sorted(list(directory.iterdir()))
-            
-            for entry in entries:
-                if entry.name in self.ignored_dirs or entry.name.startswith('.'):
-                    continue
+            with os.scandir(directory) as it:
+                return sorted(it, key=attrgetter("name"))
+        except PermissionError:
+            # We skip directories we can't read
+            return None
+        except Exception:
+            return None
 
+    def _safe_walk(
+        self,
+        pool: ThreadPoolExecutor,
+        listing: "Future[Optional[List[os.DirEntry]]]",
+        current_depth: int
+    ) -> Iterator[os.DirEntry]:
+        """
+        Generator that yields file entries recursively up to max_depth.
+
+        The walk order is the same depth-first, name-sorted order as a plain
+        recursive walk. Listings of a directory's subdirectories are
+        submitted to the pool as soon as the directory is read, so sibling
+        trees are listed concurrently while earlier ones are being walked.
+        """
+        entries = listing.result()
+        if entries is None:
+            return
+
+        try:
+            entries = [
+                entry for entry in entries
+                if not (entry.name in self.ignored_dirs or entry.name.startswith('.'))
+            ]
+
+            subdirs = {}
+            if current_depth < self.max_depth:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdirs[entry.name] = pool.submit(self._list_dir, entry.path)
+
+            for entry in entries:
                 if entry.is_dir():
-                    yield from self._safe_walk(entry, current_depth + 1)
+                    if entry.name in subdirs:
+                        yield from self._safe_walk(pool, subdirs[entry.name], current_depth + 1)
                 elif entry.is_file():
                     yield entry
-        except PermissionError:
-            # We skip directories we can't read
-            return
         except Exception:
             return
 
-    def _extract_metadata(self, path: Path) -> FileMetadata:
+    def _load_cached_previews(
+        self,
+        entries: List[os.DirEntry]
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Fetch persisted previews for unchanged files in a chunk.
+
+        Returns:
+            Dictionary mapping file path to preview, or None without a cache
+        """
+        if self.preview_cache is None:
+            return None
+
+        keys: List[FileKey] = []
+        for entry in entries:
+            if not self._has_preview(_suffix(entry.name).lower()):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                # Reported when the entry itself is processed
+                continue
+            if stat.st_size < config.MAX_FILE_SIZE_PREVIEW:
+                keys.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+        if not keys:
+            return {}
+        try:
+            return self.preview_cache.get_many(keys)
+        except sqlite3.Error as e:
+            logger.warning(f"Preview cache lookup failed: {e}")
+            return {}
+
+    def _store_cached_previews(self, entries: List[Tuple[FileKey, Optional[str]]]) -> None:
+        """Persist previews read in this chunk."""
+        if self.preview_cache is None or not entries:
+            return
+        try:
+            self.preview_cache.put_many(entries)
+        except sqlite3.Error as e:
+            logger.warning(f"Preview cache update failed: {e}")
+
+    def _extract_metadata(
+        self,
+        entry: os.DirEntry,
+        cached_previews: Optional[Dict[str, Optional[str]]] = None,
+        fresh_previews: Optional[List[Tuple[FileKey, Optional[str]]]] = None
+    ) -> FileMetadata:
         """
         Extracts metadata from a single file.
+
+        Args:
+            entry: Directory entry of the file
+            cached_previews: Previews of unchanged files from the preview cache
+            fresh_previews: Collects previews read from disk, for the cache
         """
-        stat = path.stat()
-        file_type = self._determine_file_type(path)
+        # DirEntry caches the stat result (and follows symlinks like Path.stat)
+        stat = entry.stat()
+        ext = _suffix(entry.name).lower()
+        file_type = self._determine_file_type(ext)
         
         preview = None
         # Only attempt preview if small enough
-        if stat.st_size < config.MAX_FILE_SIZE_PREVIEW:
-            preview = self._get_preview(path, file_type)
+        if stat.st_size < config.MAX_FILE_SIZE_PREVIEW and self._has_preview(ext):
+            if cached_previews is not None and entry.path in cached_previews:
+                preview = cached_previews[entry.path]
+            else:
+                preview = self._get_preview(entry.path, ext)
+                if fresh_previews is not None:
+                    fresh_previews.append(
+                        ((entry.path, stat.st_mtime_ns, stat.st_size), preview)
+                    )
 
         return FileMetadata(
-            path=str(path),
-            name=path.name,
-            extension=path.suffix.lower(),
+            path=entry.path,
+            name=entry.name,
+            extension=ext,
             size_bytes=stat.st_size,
             created_at=datetime.fromtimestamp(stat.st_ctime),
             modified_at=datetime.fromtimestamp(stat.st_mtime),
@@ -99,8 +331,7 @@ class Scanner:
             # hash is expensive, so we skip it for default scan
         )
 
-    def _determine_file_type(self, path: Path) -> FileType:
-        ext = path.suffix.lower()
+    def _determine_file_type(self, ext: str) -> FileType:
         if ext in self.text_extensions:
             return FileType.DOCUMENT # Broadly code/text is document for organization
         if ext in {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp', '.tiff'}:
@@ -115,11 +346,14 @@ class Scanner:
             return FileType.EXECUTABLE
         return FileType.UNKNOWN
 
-    def _get_preview(self, path: Path, file_type: FileType) -> Optional[str]:
+    def _has_preview(self, ext: str) -> bool:
+        """Whether files with this extension get a preview read from disk."""
+        return ext in self.text_extensions or ext in self.pdf_extensions
+
+    def _get_preview(self, path: str, ext: str) -> Optional[str]:
         """
         Safely extracts first N chars of text content.
         """
-        ext = path.suffix.lower()
         try:
             if ext in self.pdf_extensions:
                 return self._read_pdf_preview(path)
@@ -131,7 +365,7 @@ class Scanner:
             return None
         return None
 
-    def _read_text_preview(self, path: Path) -> Optional[str]:
+    def _read_text_preview(self, path: str) -> Optional[str]:
         try:
             with open(path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read(config.MAX_PREVIEW_SIZE_CHARS)
@@ -139,7 +373,7 @@ class Scanner:
         except Exception:
             return None
 
-    def _read_pdf_preview(self, path: Path) -> Optional[str]:
+    def _read_pdf_preview(self, path: str) -> Optional[str]:
         try:
             reader = PdfReader(path)
             if len(reader.pages) > 0:
@@ -0,0 +1,205 @@
+"""
+SQLite Keyed Cache
+
+Shared plumbing for the small path-keyed caches under ~/.sentinel
+(scan previews, duplicate-detection hashes).
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import (
+    Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar
+)
+
+logger = logging.getLogger(__name__)
+
+# (path, st_mtime_ns, st_size): an entry is only valid for this fingerprint
+FileKey = Tuple[str, int, int]
+
+# Rows kept per cache before the least recently used ones are evicted
+DEFAULT_MAX_ENTRIES = 200_000
+
+# Share of max_entries kept after an eviction, so eviction runs in bulk
+# rather than on every write once the cache is full
+_EVICT_KEEP_RATIO = 0.9
+
+# Paths per SELECT ... IN (...) query; below SQLite's variable limit
+_LOOKUP_BATCH_SIZE = 500
+
+# Bumped when the table layout changes; older cache files are rebuilt
+_SCHEMA_VERSION = 2
+
+_CacheT = TypeVar("_CacheT", bound="SQLiteKeyedCache")
+
+
+class SQLiteKeyedCache:
+    """
+    Base class for SQLite caches keyed by file path.
+
+    Every row holds the file's (st_mtime_ns, st_size) fingerprint, the
+    subclass's value columns and when it was last used. Lookups only return
+    rows whose fingerprint still matches. Once the table grows past
+    max_entries the least recently used rows are evicted, so entries for
+    deleted or moved files (e.g. in Downloads) don't pile up forever.
+
+    A connection is opened per call, so one cache can be shared with worker
+    threads. Each cache uses its own database file.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        table: str,
+        value_columns: Mapping[str, str],
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            table: Name of the cache table
+            value_columns: Column name -> SQL type for the cached values
+            max_entries: Row count above which old entries are evicted
+        """
+        self.db_path = os.path.expanduser(db_path)
+        self.max_entries = max_entries
+        self._table = table
+        self._value_names = tuple(value_columns)
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        columns = "".join(f"{name} {sql_type}, " for name, sql_type in value_columns.items())
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                # Written by an older layout; it's only a cache, so start over
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "path TEXT PRIMARY KEY, "
+                "mtime_ns INTEGER NOT NULL, "
+                "size INTEGER NOT NULL, "
+                f"{columns}"
+                "last_used INTEGER NOT NULL)"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_last_used ON {table} (last_used)"
+            )
+            # Upper bound on the row count, so writes only count rows when
+            # an eviction may be due
+            self._row_estimate = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    @classmethod
+    def try_open(cls: Type[_CacheT], *args, **kwargs) -> Optional[_CacheT]:
+        """
+        Open the cache, or return None if it can't be created.
+
+        A cache is only an optimization, so an unwritable home directory
+        or a broken database file shouldn't stop a run.
+
+        Returns:
+            The cache, or None if it couldn't be opened
+        """
+        try:
+            return cls(*args, **kwargs)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"{cls.__name__} unavailable, continuing without it: {e}")
+            return None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success and always close it."""
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _get_many(
+        self,
+        keys: Iterable[FileKey],
+        where: str = "",
+        params: Sequence = ()
+    ) -> Dict[str, Tuple]:
+        """
+        Look up value columns for files whose fingerprint hasn't changed.
+
+        Hits are marked as used, so they survive eviction.
+
+        Args:
+            keys: (path, st_mtime_ns, st_size) of the files to look up
+            where: Extra SQL condition rows must meet
+            params: Parameters for the extra condition
+
+        Returns:
+            Dictionary mapping file path to its value columns, for hits only
+        """
+        wanted = {path: (mtime_ns, size) for path, mtime_ns, size in keys}
+        paths = list(wanted)
+        condition = f"{where} AND " if where else ""
+        query = (
+            f"SELECT path, mtime_ns, size, {', '.join(self._value_names)} "
+            f"FROM {self._table} WHERE {condition}path IN ({{}})"
+        )
+        hits: Dict[str, Tuple] = {}
+
+        with self._connect() as conn:
+            for start in range(0, len(paths), _LOOKUP_BATCH_SIZE):
+                batch = paths[start:start + _LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(query.format(placeholders), (*params, *batch))
+                for path, mtime_ns, size, *values in rows:
+                    if wanted[path] == (mtime_ns, size):
+                        hits[path] = tuple(values)
+            if hits:
+                now = time.time_ns()
+                conn.executemany(
+                    f"UPDATE {self._table} SET last_used = ? WHERE path = ?",
+                    [(now, path) for path in hits]
+                )
+
+        return hits
+
+    def _put_many(self, entries: Iterable[Tuple[FileKey, Tuple]]) -> None:
+        """
+        Store value columns for files, replacing older entries.
+
+        Args:
+            entries: ((path, st_mtime_ns, st_size), values) pairs, with
+                values in value_columns order
+        """
+        now = time.time_ns()
+        rows: List[Tuple] = [
+            (path, mtime_ns, size, *values, now)
+            for (path, mtime_ns, size), values in entries
+        ]
+        if not rows:
+            return
+
+        names = ("path", "mtime_ns", "size", *self._value_names, "last_used")
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self._table} ({', '.join(names)}) "
+                f"VALUES ({', '.join('?' * len(names))})",
+                rows
+            )
+            self._row_estimate += len(rows)
+            if self._row_estimate > self.max_entries:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete the least recently used rows beyond the eviction low-water mark."""
+        keep = int(self.max_entries * _EVICT_KEEP_RATIO)
+        conn.execute(
+            f"DELETE FROM {self._table} WHERE path IN ("
+            f"SELECT path FROM {self._table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (keep,)
+        )
+        self._row_estimate = conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
@@ -8,7 +8,9 @@ import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from sentinel_core.cleanpc import classifiers
 from sentinel_core.cleanpc.classifiers import FileClassifier, FileClassification
+from sentinel_core.cleanpc.hash_cache import HashCache
 from sentinel_core.cleanpc.rules import OrganizationRules
 from sentinel_core.models.filesystem import FileMetadata
 from sentinel_core.models.enums import FileType
@@ -126,6 +128,111 @@ class TestFileClassifier:
         
         assert classifications[0].is_screenshot is True
 
+    def test_duplicate_detection_skips_unique_sizes(self, tmp_path):
+        """Test that duplicates are found and unique-size files aren't hashed."""
+        contents = {"a.txt": b"same", "b.txt": b"same", "c.txt": b"different"}
+        files = []
+        for i, (name, data) in enumerate(contents.items()):
+            path = tmp_path / name
+            path.write_bytes(data)
+            files.append(FileMetadata(
+                path=str(path),
+                name=name,
+                extension=".txt",
+                size_bytes=len(data),
+                created_at=datetime.now() - timedelta(days=10),
+                modified_at=datetime.now() - timedelta(days=10 - i),
+                file_type=FileType.DOCUMENT
+            ))
+
+        classifier = FileClassifier()
+        classifications = classifier.classify_all(files)
+
+        assert classifications[0].is_duplicate is True
+        assert classifications[0].duplicate_of == files[1].path
+        assert classifications[1].is_duplicate is False
+        assert files[2].path not in classifier._hash_cache
+
+    def test_duplicate_detection_samples_before_full_hash(self, tmp_path):
+        """Test that files whose head/tail sample differs are never fully hashed."""
+        base = bytes(range(256)) * 64  # 16 KiB
+        middle_changed = base[:8000] + b"x" + base[8001:]
+        head_changed = b"x" + base[1:]
+        contents = {
+            "a.bin": base, "b.bin": base,
+            "c.bin": middle_changed, "d.bin": head_changed,
+        }
+        files = []
+        for i, (name, data) in enumerate(contents.items()):
+            path = tmp_path / name
+            path.write_bytes(data)
+            files.append(FileMetadata(
+                path=str(path),
+                name=name,
+                extension=".bin",
+                size_bytes=len(data),
+                created_at=datetime.now() - timedelta(days=10),
+                modified_at=datetime.now() - timedelta(days=10 - i),
+                file_type=FileType.UNKNOWN
+            ))
+
+        classifier = FileClassifier()
+        hashed = []
+        compute_hash = classifier._compute_hash
+        def tracking_hash(filepath):
+            hashed.append(filepath)
+            return compute_hash(filepath)
+        classifier._compute_hash = tracking_hash
+        classifications = classifier.classify_all(files)
+
+        assert classifications[0].is_duplicate is True
+        assert classifications[0].duplicate_of == files[1].path
+        assert classifications[2].is_duplicate is False
+        assert classifications[3].is_duplicate is False
+        assert sorted(hashed) == sorted(f.path for f in files[:3])
+
+    def test_hash_cache_reused_across_runs(self, tmp_path):
+        """Test that unchanged files take their hash from the persistent cache."""
+        files = []
+        for i, name in enumerate(["a.txt", "b.txt"]):
+            path = tmp_path / name
+            path.write_bytes(b"same")
+            files.append(FileMetadata(
+                path=str(path),
+                name=name,
+                extension=".txt",
+                size_bytes=4,
+                created_at=datetime.now() - timedelta(days=10),
+                modified_at=datetime.now() - timedelta(days=10 - i),
+                file_type=FileType.DOCUMENT
+            ))
+        cache = HashCache(str(tmp_path / "hashes.db"))
+
+        FileClassifier(hash_cache=cache).classify_all(files)
+
+        # A second run must not read the files again
+        classifier = FileClassifier(hash_cache=cache)
+        def fail(filepath):
+            raise AssertionError(f"re-hashed {filepath}")
+        classifier._compute_hash = fail
+        classifications = classifier.classify_all(files)
+
+        assert classifications[0].is_duplicate is True
+        assert classifications[0].duplicate_of == files[1].path
+
+        # A changed modification time invalidates the entry
+        algorithm = classifiers._HASH_ALGORITHM_NAME
+        changed = files[0].model_copy(update={"modified_at": datetime.now()})
+        assert files[0].path in cache.get_many([files[0]], algorithm)
+        assert changed.path not in cache.get_many([changed], algorithm)
+
+    def test_hash_cache_unavailable(self, tmp_path):
+        """Test that a cache that can't be created is skipped, not raised."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("file")
+
+        assert HashCache.try_open(str(blocker / "hashes.db")) is None
+
 
 class TestOrganizationRules:
     """Tests for organization rules."""
@@ -35,6 +35,19 @@ def test_get_engine_creates_default_path():
         assert os.path.exists(db_path)
 
 
+def test_get_engine_shared_connection_reuses_connection():
+    """Test that a shared-connection engine hands out one SQLite connection."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = get_engine(os.path.join(tmpdir, "shared.db"), shared_connection=True)
+        
+        with engine.connect() as first:
+            first_dbapi = first.connection.dbapi_connection
+        with engine.connect() as second:
+            assert second.connection.dbapi_connection is first_dbapi
+        
+        engine.dispose()
+
+
 def test_create_tables():
     """Test table creation."""
     engine = create_engine("sqlite:///:memory:")
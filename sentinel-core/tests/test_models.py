@@ -18,6 +18,19 @@ def test_file_metadata_valid():
     assert fm.name == "test.txt"
     assert fm.file_type == FileType.DOCUMENT
 
+def test_file_metadata_extension_lowercased():
+    """Test that extensions are normalized to lowercase."""
+    fm = FileMetadata(
+        path="/tmp/PHOTO.JPG",
+        name="PHOTO.JPG",
+        extension=".JPG",
+        size_bytes=1024,
+        created_at=datetime.now(),
+        modified_at=datetime.now(),
+        file_type=FileType.IMAGE
+    )
+    assert fm.extension == ".jpg"
+
 def test_plan_schema_validation():
     """Test strict validation of PlanSchema."""
     # Valid Plan
@@ -47,3 +60,48 @@ def test_plan_action_invalid_destination():
             reason="test",
             confidence=1.0
         )
+
+def test_websocket_event_to_json_matches_model_dump_json():
+    """Test that the fast event serializer produces pydantic's output."""
+    from sentinel_core.api.models.events import WebSocketEvent, EventType
+    
+    plan = PlanSchema(
+        task_id="123",
+        scope_path="/tmp",
+        actions=[
+            PlanAction(
+                type=ActionType.MOVE,
+                source_path="/tmp/a",
+                destination_path="/tmp/b/a",
+                reason="test",
+                confidence=0.9
+            )
+        ],
+        summary="Test"
+    )
+    event = WebSocketEvent(
+        event_type=EventType.PLAN_READY,
+        task_id="123",
+        message="Plan ready",
+        data={"plan": plan.model_dump(mode="json"), "summary": {"operations": 1}}
+    )
+    assert event.to_json() == event.model_dump_json()
+
+def test_build_event_payload_matches_websocket_event():
+    """Test that unvalidated event payloads have the model's wire form."""
+    import json
+    from sentinel_core.api.models.events import (
+        WebSocketEvent, EventType, build_event_payload
+    )
+    
+    payload = build_event_payload(
+        EventType.EXECUTION_PROGRESS, "123", "Starting execution...", {"progress": 0}
+    )
+    event = WebSocketEvent(
+        event_type=EventType.EXECUTION_PROGRESS,
+        task_id="123",
+        ts_ns=payload["ts_ns"],
+        message="Starting execution...",
+        data={"progress": 0}
+    )
+    assert json.dumps(payload, separators=(",", ":")) == event.model_dump_json()
@@ -0,0 +1,170 @@
+"""
+Tests for Safety Validator Path Checks
+
+Tests symlink rejection, protected-path prefixes and the filesystem
+lookup shortcuts (trusted parents, shared validation cache).
+"""
+
+import os
+import sys
+
+import pytest
+
+from sentinel_core.models.enums import ActionType
+from sentinel_core.models.planner import PlanAction, PlanSchema
+from sentinel_core.safety import safety
+from sentinel_core.safety.safety import IssueCode, SafetyValidator
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX paths and symlinks")
+
+
+def _move(source, destination) -> PlanAction:
+    return PlanAction(
+        type=ActionType.MOVE,
+        source_path=str(source),
+        destination_path=str(destination),
+        reason="Organize",
+        confidence=0.9
+    )
+
+
+def _plan(scope, actions, folders=()) -> PlanSchema:
+    return PlanSchema(
+        task_id="test-123",
+        scope_path=str(scope),
+        folders_to_create=[str(f) for f in folders],
+        actions=actions,
+        summary="Test plan"
+    )
+
+
+@pytest.fixture
+def scope(tmp_path):
+    """A real (symlink-free) scope directory."""
+    root = tmp_path.resolve() / "scope"
+    root.mkdir()
+    return root
+
+
+class TestSymlinkRejection:
+    """Tests that symlinks can't redirect an operation."""
+
+    def test_reject_symlinked_source(self, scope):
+        """Test that a symlinked source is rejected, not followed."""
+        target = scope / "real.txt"
+        target.write_text("data")
+        link = scope / "link.txt"
+        link.symlink_to(target)
+
+        result = SafetyValidator().validate_plan(
+            _plan(scope, [_move(link, scope / "moved.txt")])
+        )
+
+        assert result.is_safe is False
+        assert (IssueCode.SYMLINKED_SOURCE, str(link)) in result.issues
+
+    def test_reject_symlinked_destination(self, scope):
+        """Test that a destination that is itself a symlink is rejected."""
+        source = scope / "file.txt"
+        source.write_text("data")
+        link = scope / "dest.txt"
+        link.symlink_to(scope / "elsewhere.txt")
+
+        result = SafetyValidator().validate_plan(_plan(scope, [_move(source, link)]))
+
+        assert result.is_safe is False
+        assert (IssueCode.SYMLINKED_DESTINATION, str(link)) in result.issues
+
+    def test_destination_under_symlinked_parent_checked_at_target(self, scope):
+        """Test that a destination inside a symlinked folder is checked where it really lands."""
+        source = scope / "file.txt"
+        source.write_text("data")
+        (scope / "Config").symlink_to("/etc")
+
+        result = SafetyValidator().validate_plan(
+            _plan(scope, [_move(source, scope / "Config" / "file.txt")])
+        )
+
+        real_dest = os.path.join(os.path.realpath("/etc"), "file.txt")
+        assert result.is_safe is False
+        assert (IssueCode.PROTECTED_DESTINATION, real_dest) in result.issues
+
+
+class TestProtectedPaths:
+    """Tests for protected path prefix matching."""
+
+    def test_protected_prefix_respects_separator(self):
+        """Test that /etc/x is protected but /etcfoo is not."""
+        validator = SafetyValidator()
+
+        assert validator._is_protected("/etc") is True
+        assert validator._is_protected("/etc/x") is True
+        assert validator._is_protected("/etcfoo") is False
+        assert validator._is_protected("/etcfoo/x") is False
+
+
+class TestLookupShortcuts:
+    """Tests that filesystem lookup shortcuts don't change the outcome."""
+
+    @pytest.fixture
+    def realpath_calls(self, monkeypatch):
+        """Record the paths the validator canonicalizes."""
+        calls = []
+        real = safety._cached_realpath
+
+        def spy(path):
+            calls.append(path)
+            return real(path)
+
+        spy.cache_clear = real.cache_clear
+        monkeypatch.setattr(safety, "_cached_realpath", spy)
+        return calls
+
+    def test_symlink_disables_trusted_parent_fast_path(self, scope, realpath_calls):
+        """Test that one symlink in the plan forces realpath for every destination."""
+        folder = scope / "Docs"
+        folder.mkdir()
+        source = scope / "file.txt"
+        source.write_text("data")
+        dest = folder / "file.txt"
+
+        # Destinations directly inside a created, symlink-free folder skip realpath
+        SafetyValidator().validate_plan(_plan(scope, [_move(source, dest)], [folder]))
+        assert str(dest) not in realpath_calls
+
+        # ...unless any action in the plan involves a symlink
+        link = scope / "link.txt"
+        link.symlink_to(source)
+        realpath_calls.clear()
+        result = SafetyValidator().validate_plan(_plan(
+            scope,
+            [_move(source, dest), _move(link, folder / "link.txt")],
+            [folder]
+        ))
+        assert str(dest) in realpath_calls
+        assert (IssueCode.SYMLINKED_SOURCE, str(link)) in result.issues
+
+    def test_validation_cache_reused(self, scope, monkeypatch):
+        """Test that a shared cache skips lookups but gives the same issues."""
+        source = scope / "file.txt"
+        source.write_text("data")
+        link = scope / "link.txt"
+        link.symlink_to(source)
+        plan = _plan(scope, [
+            _move(source, scope / "moved.txt"),
+            _move(link, scope / "moved_link.txt"),
+            _move(scope / "missing.txt", scope / "x.txt"),
+        ])
+        validator = SafetyValidator()
+        cache = {}
+
+        first = validator.validate_plan(plan, cache)
+
+        def fail(path):
+            raise AssertionError(f"re-checked {path}")
+        monkeypatch.setattr(validator, "_is_symlink", fail)
+        second = validator.validate_plan(plan, cache)
+
+        assert second.issues == first.issues
+        assert (IssueCode.SYMLINKED_SOURCE, str(link)) in second.issues
+        assert (IssueCode.SOURCE_MISSING, str(scope / "missing.txt")) in second.issues
@@ -7,6 +7,7 @@ Tests file scanning, type detection, and metadata extraction.
 import pytest
 from pathlib import Path
 
+from sentinel_core.scanner.preview_cache import PreviewCache
 from sentinel_core.scanner.scanner import Scanner
 from sentinel_core.models.enums import FileType
 
@@ -59,6 +60,91 @@ class TestBasicScanning:
         
         assert len(result.files) == 3
 
+    def test_scan_progress_callback(self, mock_fs, monkeypatch):
+        """Test that on_progress receives running file counts."""
+        from sentinel_core.scanner import config
+        monkeypatch.setattr(config, "SCAN_PROGRESS_INTERVAL", 2)
+        for i in range(5):
+            mock_fs.create_file(f"root/file{i}.txt")
+
+        counts = []
+        result = Scanner(mock_fs.get_path("root")).scan(on_progress=counts.append)
+
+        assert len(result.files) == 5
+        assert counts == [2, 4]
+
+    def test_scan_many(self, mock_fs):
+        """Test scanning several roots with one scanner."""
+        mock_fs.create_file("one/file1.txt")
+        mock_fs.create_file("two/file2.txt")
+        mock_fs.create_file("two/sub/file3.txt")
+
+        scanner = Scanner(max_depth=0)
+        results = scanner.scan_many([
+            mock_fs.get_path("one"),
+            mock_fs.get_path("two"),
+            mock_fs.get_path("missing"),
+        ])
+
+        assert [len(r.files) for r in results] == [1, 1, 0]
+        assert results[1].root_path == mock_fs.get_path("two")
+        assert "not found" in results[2].errors[0].lower()
+
+    def test_scan_iter_batches(self, mock_fs):
+        """Test that scan_iter yields the same files in bounded batches."""
+        for i in range(5):
+            mock_fs.create_file(f"root/file{i}.txt")
+
+        scanner = Scanner(mock_fs.get_path("root"))
+        batches = list(scanner.scan_iter(batch_size=2))
+
+        assert [len(b.files) for b in batches] == [2, 2, 1]
+        assert [f.path for b in batches for f in b.files] == [
+            f.path for f in scanner.scan().files
+        ]
+
+    def test_preview_cache_reused_across_scans(self, mock_fs, tmp_path):
+        """Test that unchanged files take their preview from the cache."""
+        mock_fs.create_file("root/notes.txt", content="Hello")
+        cache = PreviewCache(str(tmp_path / "previews.db"))
+
+        first = Scanner(mock_fs.get_path("root"), preview_cache=cache).scan()
+
+        # A second scan must not read the file again
+        scanner = Scanner(mock_fs.get_path("root"), preview_cache=cache)
+        def fail(path):
+            raise AssertionError(f"re-read {path}")
+        scanner._read_text_preview = fail
+        second = scanner.scan()
+
+        assert second.files[0].preview_text == first.files[0].preview_text == "Hello"
+
+        # A changed file is read again
+        mock_fs.create_file("root/notes.txt", content="Changed content")
+        third = Scanner(mock_fs.get_path("root"), preview_cache=cache).scan()
+
+        assert third.files[0].preview_text == "Changed content"
+
+    def test_preview_cache_evicts_least_recently_used(self, tmp_path):
+        """Test that a full cache drops the entries used longest ago."""
+        cache = PreviewCache(str(tmp_path / "previews.db"), max_entries=10)
+        cache.put_many(((f"/f{i}", 1, 1), "text") for i in range(10))
+        # Touch the first half so the second half is least recently used
+        assert len(cache.get_many([(f"/f{i}", 1, 1) for i in range(5)])) == 5
+
+        cache.put_many([(("/new", 1, 1), "text")])
+
+        kept = cache.get_many([(f"/f{i}", 1, 1) for i in range(10)] + [("/new", 1, 1)])
+        assert len(kept) == 9
+        assert {f"/f{i}" for i in range(5)} | {"/new"} <= set(kept)
+
+    def test_preview_cache_unavailable(self, tmp_path):
+        """Test that a cache that can't be created is skipped, not raised."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("file")
+
+        assert PreviewCache.try_open(str(blocker / "previews.db")) is None
+
 
 class TestFileTypeDetection:
     """Tests for file type classification."""
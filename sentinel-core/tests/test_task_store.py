@@ -0,0 +1,102 @@
+"""
+Tests for the API In-Memory Task Store
+
+Tests task updates, creation ordering and the cached plan JSON.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from sentinel_core.api import memory
+from sentinel_core.models.enums import ActionType
+from sentinel_core.models.planner import PlanAction, PlanSchema
+
+
+def _plan(summary: str) -> PlanSchema:
+    return PlanSchema(
+        task_id="plan-task",
+        scope_path="/tmp/scope",
+        actions=[
+            PlanAction(
+                type=ActionType.DELETE,
+                source_path="/tmp/scope/old.dmg",
+                reason="Old installer",
+                confidence=0.9
+            )
+        ],
+        summary=summary
+    )
+
+
+@pytest.fixture
+def task_id():
+    """A task ID no other test uses (the store is module-global)."""
+    return f"test-{uuid.uuid4()}"
+
+
+class TestSaveTask:
+    """Tests for saving and updating tasks."""
+
+    def test_update_merges_and_keeps_created_at(self, task_id):
+        """Test that updates merge into the task and created_at is stamped once."""
+        memory.save_task(task_id, {"state": "planning"})
+        created_at = memory.get_task(task_id)["created_at"]
+
+        memory.save_task(task_id, {"summary": "done"})
+        task = memory.get_task(task_id)
+
+        assert isinstance(created_at, datetime)
+        assert task["created_at"] == created_at
+        assert task["state"] == "planning"
+        assert task["summary"] == "done"
+
+    def test_recent_task_ids_newest_first(self):
+        """Test that listing returns tasks newest first, with offset and limit."""
+        ids = [f"test-{uuid.uuid4()}" for _ in range(3)]
+        for tid in ids:
+            memory.save_task(tid, {})
+        # Updating a task doesn't move it in the creation order
+        memory.save_task(ids[0], {"state": "review"})
+
+        assert memory.list_recent_task_ids(limit=3) == ids[::-1]
+        assert memory.list_recent_task_ids(offset=1, limit=1) == [ids[1]]
+
+
+class TestPlanJsonCache:
+    """Tests for the cached JSON dump of a task's plan."""
+
+    def test_plan_json_cached(self, task_id):
+        """Test that the dump is built once and reused."""
+        memory.save_task(task_id, {"plan": _plan("first")})
+
+        first = memory.get_plan_json(task_id)
+
+        assert first["summary"] == "first"
+        assert memory.get_plan_json(task_id) is first
+
+    def test_new_plan_invalidates_cached_json(self, task_id):
+        """Test that saving a plan without plan_json never serves the old dump."""
+        memory.save_task(task_id, {"plan": _plan("first")})
+        memory.get_plan_json(task_id)
+
+        memory.save_task(task_id, {"plan": _plan("second")})
+
+        assert memory.get_plan_json(task_id)["summary"] == "second"
+
+    def test_plan_json_supplied_with_plan_is_kept(self, task_id):
+        """Test that a caller-provided dump is stored as the cache."""
+        plan = _plan("first")
+        plan_json = plan.model_dump(mode="json")
+
+        memory.save_task(task_id, {"plan": plan, "plan_json": plan_json})
+
+        assert memory.get_plan_json(task_id) is plan_json
+
+    def test_missing_plan(self, task_id):
+        """Test that tasks without a plan have no plan JSON."""
+        memory.save_task(task_id, {"state": "planning"})
+
+        assert memory.get_plan_json(task_id) is None
+        assert memory.get_plan_json(f"missing-{task_id}") is None
@@ -0,0 +1,93 @@
+"""
+Tests for the WebSocket Manager
+
+Tests coalescing of progress events and that no progress frame follows
+a task's final event.
+"""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+
+from sentinel_core.api.models.events import EventType, build_event_payload
+from sentinel_core.api.websocket import manager as ws
+from sentinel_core.api.websocket.manager import WebSocketManager
+
+
+class FakeWebSocket:
+    """Records sent frames; sends for `block_task` wait until released."""
+
+    def __init__(self, block_task=None):
+        self.frames = []
+        self.block_task = block_task
+        self.blocked = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        frame = json.loads(text)
+        if frame.get("task_id") == self.block_task and frame["event_type"] == "PROGRESS":
+            self.blocked.set()
+            await self.release.wait()
+        self.frames.append(frame)
+
+
+def _progress(task_id, files_scanned):
+    return build_event_payload(
+        EventType.PROGRESS, task_id=task_id, data={"files_scanned": files_scanned}
+    )
+
+
+def _task_frames(socket, task_id):
+    return [
+        (f["event_type"], f["data"].get("files_scanned"))
+        for f in socket.frames if f.get("task_id") == task_id
+    ]
+
+
+@pytest_asyncio.fixture
+async def manager():
+    wm = WebSocketManager()
+    yield wm
+    await wm.shutdown()
+
+
+class TestProgressEvents:
+    """Tests for queued progress events."""
+
+    @pytest.mark.asyncio
+    async def test_rapid_progress_coalesced_to_latest(self, manager):
+        """Test that several queued payloads for one task send only the latest."""
+        socket = FakeWebSocket()
+        await manager.connect(socket, "client")
+
+        for count in (100, 200, 300):
+            manager.queue_progress(_progress("task", count))
+        await asyncio.sleep(ws.PROGRESS_FLUSH_INTERVAL / 2)
+
+        assert _task_frames(socket, "task") == [("PROGRESS", 300)]
+
+    @pytest.mark.asyncio
+    async def test_no_progress_after_discard_mid_send(self, manager):
+        """Test that a task discarded while its batch is sending gets no later frame."""
+        socket = FakeWebSocket(block_task="first")
+        await manager.connect(socket, "client")
+
+        manager.queue_progress(_progress("first", 1))
+        manager.queue_progress(_progress("second", 1))
+        # The loop has taken both payloads and is stuck sending "first"
+        await asyncio.wait_for(socket.blocked.wait(), timeout=1)
+
+        manager.discard_progress("second")
+        await manager.broadcast_batched(
+            build_event_payload(EventType.SCAN_COMPLETE, task_id="second")
+        )
+        socket.release.set()
+        await asyncio.sleep(ws.PROGRESS_FLUSH_INTERVAL * 2)
+
+        assert _task_frames(socket, "second") == [("SCAN_COMPLETE", None)]
+        assert _task_frames(socket, "first") == [("PROGRESS", 1)]